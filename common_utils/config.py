@@ -1,55 +1,166 @@
 import os
 import json
-from typing import Dict, Any
-
-class ConfigManager:
-  
-    @staticmethod
-    def load_config(config_path: str = None) -> Dict[str, Any]:
-       
-        # Default config path
-        if not config_path:
-            config_path = os.path.join(
-                os.path.dirname(__file__), 
-                '..', '..', 'config', 'login_config.json'
-            )
-        
-        try:
-            # Ensure absolute path
-            config_path = os.path.abspath(config_path)
-            
-            # Check file exists
-            if not os.path.exists(config_path):
-                raise FileNotFoundError(f"Configuration file not found: {config_path}")
-            
-            # Read and parse JSON
-            with open(config_path, 'r') as config_file:
-                config = json.load(config_file)
-            
-            return config
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            raise type(e)(f"Error loading configuration: {str(e)}")
-    
-    @staticmethod
-    def get_env_config(key: str, default: Any = None) -> Any:
-      
-        return os.environ.get(key, default)
-    
-    @staticmethod
-    def save_config(config: Dict[str, Any], config_path: str = None):
-       
-        if not config_path:
-            config_path = os.path.join(
-                os.path.dirname(__file__), 
-                '..', '..', 'config', 'login_config.json'
-            )
-        
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Optional
+
+from common_utils.exceptions import ConfigError
+
+# Repository data directory; CONFIG_DIR points the service somewhere else
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a plain, mutable (JSON serialisable) copy of a frozen config value."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def _require(condition: bool, name: str, message: str):
+    if not condition:
+        raise ConfigError(f"Invalid {name} config: {message}")
+
+
+def _overlay_login_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Layer BASE_URL, EMAIL, PASSWORD, API_BASE_URL and API_TIMEOUT over login_config.json."""
+    login = config.setdefault("login", {})
+    api = config.setdefault("api", {})
+
+    login["url"] = os.getenv("BASE_URL") or login.get("url", "")
+    login["email"] = os.getenv("EMAIL") or login.get("email", "")
+    login["password"] = os.getenv("PASSWORD") or login.get("password", "")
+    api["base_url"] = os.getenv("API_BASE_URL") or api.get("base_url") or login["url"]
+    api["timeout"] = int(os.getenv("API_TIMEOUT") or api.get("timeout") or 30000)
+    return config
+
+
+def _validate_login_config(config: Dict[str, Any]):
+    _require(isinstance(config.get("login"), dict), "login_config", "'login' section missing")
+    _require(isinstance(config.get("api"), dict), "login_config", "'api' section missing")
+    for key in ("url", "email", "password"):
+        _require(key in config["login"], "login_config", f"'login.{key}' missing")
+
+
+def _validate_pipeline_filters(config: Dict[str, Any]):
+    filters = config.get("filters")
+    _require(isinstance(filters, list), "pipeline_filters", "'filters' must be a list")
+    allowed = {"branch", "dsr", "lob", "tier"}
+    for index, case in enumerate(filters):
+        _require(isinstance(case, dict), "pipeline_filters", f"filters[{index}] must be an object")
+        unknown = set(case) - allowed
+        _require(not unknown, "pipeline_filters", f"filters[{index}] has unknown keys {sorted(unknown)}")
+
+
+def _validate_reports_navigation(config: Any):
+    _require(isinstance(config, list), "reports_navigation", "top level must be a list")
+    for index, entry in enumerate(config):
+        _require("name" in entry, "reports_navigation", f"entry {index} has no name")
+        for section, keys in (("navigation", ("report", "view")), ("download", ("button", "selector", "filename"))):
+            for key in keys:
+                _require(key in entry.get(section, {}), "reports_navigation",
+                         f"'{entry.get('name')}' (entry {index}) missing {section}.{key}")
+        if "export" in entry:
+            _require("endpoint" in entry["export"], "reports_navigation",
+                     f"'{entry.get('name')}' (entry {index}) missing export.endpoint")
+
+
+def _overlay_test_users(config: Dict[str, Any]) -> Dict[str, Any]:
+    """TEST_USERS (a JSON list) replaces test_users.json; with no users at all, EMAIL/PASSWORD is the one user."""
+    if os.getenv("TEST_USERS"):
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
-            
-            # Write configuration
-            with open(config_path, 'w') as config_file:
-                json.dump(config, config_file, indent=4)
-        except IOError as e:
-            raise IOError(f"Error saving configuration: {str(e)}")
+            config = {"users": json.loads(os.getenv("TEST_USERS"))}
+        except json.JSONDecodeError as e:
+            raise ConfigError(f"Error parsing TEST_USERS: {str(e)}")
+    if not config.get("users") and os.getenv("EMAIL"):
+        config = {"users": [{"email": os.getenv("EMAIL"), "password": os.getenv("PASSWORD"), "role": "default"}]}
+    return config
+
+
+def _validate_test_users(config: Dict[str, Any]):
+    users = config.get("users")
+    _require(isinstance(users, list), "test_users", "'users' must be a list")
+    for index, user in enumerate(users):
+        _require(isinstance(user, dict), "test_users", f"users[{index}] must be an object")
+        _require(bool(user.get("email")) and bool(user.get("password")), "test_users",
+                 f"users[{index}] ({user.get('email')}) needs both email and password")
+
+
+class ConfigService:
+    """
+    Single entry point for JSON config under data/.
+    Each file is loaded, env-overlaid and validated once per process and cached as a read-only
+    structure, so fixtures can share it freely. Nothing is ever written back to the repo.
+    """
+
+    # name -> (required, default when missing, env overlay, validator)
+    SCHEMAS: Dict[str, tuple] = {
+        "login_config": (False, {}, _overlay_login_config, _validate_login_config),
+        "pipeline_filters": (True, None, None, _validate_pipeline_filters),
+        "reports_navigation": (True, None, None, _validate_reports_navigation),
+        "reports_config": (False, {}, None, None),
+        "api_endpoints": (False, {}, None, None),
+        "api_test_data": (False, {}, None, None),
+        "validator_config": (False, {}, None, None),
+        "graph_responses": (False, {"graphs": {}}, None, None),
+        "test_users": (False, {"users": []}, _overlay_test_users, _validate_test_users),
+    }
+
+    _cache: Dict[str, Any] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def data_dir(cls) -> str:
+        return os.getenv("CONFIG_DIR", DATA_DIR)
+
+    @classmethod
+    def get(cls, name: str) -> Any:
+        """Return the cached, validated, read-only config named `name` (file data/<name>.json)."""
+        if name in cls._cache:
+            return cls._cache[name]
+
+        with cls._lock:
+            if name not in cls._cache:
+                cls._cache[name] = freeze(cls._load(name))
+            return cls._cache[name]
+
+    @classmethod
+    def _load(cls, name: str) -> Any:
+        required, default, overlay, validator = cls.SCHEMAS.get(name, (False, {}, None, None))
+        path = os.path.join(cls.data_dir(), f"{name}.json")
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as config_file:
+                    config = json.load(config_file)
+            except json.JSONDecodeError as e:
+                raise ConfigError(f"Error parsing {path}: {str(e)}")
+        elif required:
+            raise ConfigError(f"Configuration file not found: {path}")
+        else:
+            config = json.loads(json.dumps(default))
+
+        if overlay:
+            config = overlay(config)
+        if validator:
+            validator(config)
+        return config
+
+    @classmethod
+    def clear_cache(cls, name: Optional[str] = None):
+        """Forget one (or every) cached config so the next get() reads disk again."""
+        with cls._lock:
+            if name:
+                cls._cache.pop(name, None)
+            else:
+                cls._cache.clear()
@@ -0,0 +1,145 @@
+import json
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Union
+
+
+class BrowserContextPool:
+    """Pool of pre-created, pre-authenticated browser contexts that tests lease and return."""
+
+    def __init__(self, browser, context_args: Dict[str, Any], storage_state: Union[str, Dict[str, Any], None] = None,
+                 size: int = 2, max_size: int = None, neutral_url: str = None):
+        self.browser = browser
+        self.context_args = context_args
+        self.storage_state = storage_state
+        self.size = size
+        self.max_size = max_size or size
+        self.neutral_url = neutral_url
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._baseline = self._load_baseline(storage_state)
+        self._idle: List[Any] = []
+        self._all: List[Any] = []
+        self._lease_waits: List[float] = []
+        self._reset_costs: List[float] = []
+        self._created = 0
+
+        for _ in range(size):
+            self._idle.append(self._create_context())
+
+    @staticmethod
+    def _load_baseline(storage_state: Union[str, Dict[str, Any], None]) -> Dict[str, Any]:
+        """Read the storage state (file path or in-memory dict) that every context is reset back to."""
+        if not storage_state:
+            return {"cookies": [], "origins": []}
+        if isinstance(storage_state, dict):
+            return storage_state
+        with open(storage_state, 'r') as f:
+            return json.load(f)
+
+    def _create_context(self):
+        """Create a context from the cached login and open its working page."""
+        context = self.browser.new_context(**self.context_args, storage_state=self.storage_state)
+        page = context.new_page()
+        if self.neutral_url:
+            page.goto(self.neutral_url, wait_until="domcontentloaded")
+        self._all.append(context)
+        self._created += 1
+        return context
+
+    def acquire(self):
+        """Lease an idle context, creating one if the pool has not reached max_size."""
+        start_time = time.perf_counter()
+        if self._idle:
+            context = self._idle.pop()
+        elif len(self._all) < self.max_size:
+            self.logger.info(f"Pool exhausted; growing to {len(self._all) + 1} contexts")
+            context = self._create_context()
+        else:
+            raise RuntimeError(f"All {self.max_size} pooled contexts are leased")
+
+        self._lease_waits.append(time.perf_counter() - start_time)
+        return context
+
+    def release(self, context):
+        """Reset a leased context and return it to the pool, discarding it if the reset fails."""
+        start_time = time.perf_counter()
+        try:
+            self.reset(context)
+        except Exception as e:
+            self.logger.warning(f"Context reset failed, discarding it: {str(e)}")
+            self._all.remove(context)
+            context.close()
+            return
+        self._reset_costs.append(time.perf_counter() - start_time)
+        self._idle.append(context)
+
+    def reset(self, context):
+        """Restore a context to the authenticated baseline without tearing it down."""
+        pages = context.pages
+        for extra_page in pages[1:]:
+            extra_page.close()
+        page = pages[0] if pages else context.new_page()
+
+        context.clear_cookies()
+        if self._baseline["cookies"]:
+            context.add_cookies(self._baseline["cookies"])
+
+        origin_storage = {
+            origin["origin"]: {item["name"]: item["value"] for item in origin.get("localStorage", [])}
+            for origin in self._baseline.get("origins", [])
+        }
+        if page.url.startswith("http"):
+            page.evaluate(
+                """storage => {
+                    sessionStorage.clear();
+                    localStorage.clear();
+                    const items = storage[location.origin] || {};
+                    for (const [name, value] of Object.entries(items)) {
+                        localStorage.setItem(name, value);
+                    }
+                }""",
+                origin_storage
+            )
+
+        if self.neutral_url:
+            page.goto(self.neutral_url, wait_until="domcontentloaded")
+
+    @contextmanager
+    def lease(self):
+        """Lease a context for the duration of a `with` block."""
+        context = self.acquire()
+        try:
+            yield context
+        finally:
+            self.release(context)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return lease wait and reset cost figures for sizing the pool."""
+        def summary(samples: List[float]) -> Dict[str, float]:
+            if not samples:
+                return {"count": 0, "avg_ms": 0.0, "max_ms": 0.0}
+            return {
+                "count": len(samples),
+                "avg_ms": round(sum(samples) / len(samples) * 1000, 1),
+                "max_ms": round(max(samples) * 1000, 1),
+            }
+
+        return {
+            "size": self.size,
+            "max_size": self.max_size,
+            "contexts_created": self._created,
+            "lease_wait": summary(self._lease_waits),
+            "reset_cost": summary(self._reset_costs),
+        }
+
+    def close(self):
+        """Close every context owned by the pool."""
+        for context in self._all:
+            try:
+                context.close()
+            except Exception:
+                pass
+        self._all.clear()
+        self._idle.clear()
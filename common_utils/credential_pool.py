@@ -0,0 +1,47 @@
+import logging
+from typing import Dict, Any, List, Optional
+
+from common_utils.config import ConfigService, thaw
+
+
+class CredentialPool:
+    """Pool of test users tagged by role, region and distributor."""
+
+    TAGS = ("role", "region", "distributor")
+
+    def __init__(self, users: List[Dict[str, Any]]):
+        self.users = users
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def load(cls) -> "CredentialPool":
+        """
+        Load users from data/test_users.json through ConfigService (TEST_USERS env var overrides it).
+        Falls back to the single EMAIL/PASSWORD user.
+        """
+        return cls(thaw(ConfigService.get("test_users")["users"]))
+
+    def matching(self, **tags) -> List[Dict[str, Any]]:
+        """Return users whose tags equal every non-empty value in `tags`."""
+        wanted = {key: value for key, value in tags.items() if value is not None}
+        unknown = set(wanted) - set(self.TAGS)
+        if unknown:
+            raise ValueError(f"Unknown user tags: {sorted(unknown)}")
+        return [user for user in self.users if all(user.get(key) == value for key, value in wanted.items())]
+
+    def select(self, worker_id: Optional[str] = None, **tags) -> Dict[str, Any]:
+        """
+        Pick a matching user for this worker.
+        Workers are spread round-robin so parallel workers get different users when enough exist.
+        """
+        candidates = self.matching(**tags)
+        if not candidates:
+            raise LookupError(f"No test user matches {tags}")
+
+        worker_index = 0
+        if worker_id and worker_id.startswith("gw"):
+            worker_index = int(worker_id[2:])
+
+        user = candidates[worker_index % len(candidates)]
+        self.logger.info(f"Worker {worker_id or 'main'} using {user['email']} for {tags}")
+        return user
@@ -0,0 +1,83 @@
+import time
+from typing import Dict, Any, List, Optional
+
+from common_utils.exceptions import DeadlineExceededError
+
+
+class Deadline:
+    """
+    Time budget for a single test. Every page-object wait asks for its timeout through
+    `timeout()`, which grants min(own timeout, remaining budget) and remembers who asked,
+    so a failure can be attributed to the wait that used the budget up.
+    """
+
+    def __init__(self, budget_ms: int, name: str = "test"):
+        self.budget_ms = budget_ms
+        self.name = name
+        self.started_at = time.perf_counter()
+        self.waits: List[Dict[str, Any]] = []
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def remaining_ms(self) -> float:
+        return self.budget_ms - self.elapsed_ms()
+
+    def timeout(self, own_timeout_ms: float, label: str) -> int:
+        """Return the timeout a wait may use, or raise if the budget is already spent."""
+        now = time.perf_counter()
+        self._close_last_wait(now)
+
+        remaining = self.remaining_ms()
+        if remaining <= 0:
+            raise DeadlineExceededError(
+                f"{self.name} exceeded its {self.budget_ms} ms budget before {label}. {self.summary()}"
+            )
+
+        # Playwright treats 0 as "no timeout", so never hand out less than 1 ms
+        granted = max(1, int(min(own_timeout_ms, remaining)))
+        self.waits.append({"label": label, "requested_ms": own_timeout_ms, "granted_ms": granted,
+                           "started": now, "used_ms": None})
+        return granted
+
+    def _close_last_wait(self, now: float):
+        """Attribute the time since the previous wait started to that wait."""
+        if self.waits and self.waits[-1]["used_ms"] is None:
+            self.waits[-1]["used_ms"] = round((now - self.waits[-1]["started"]) * 1000, 1)
+
+    def top_waits(self, limit: int = 3) -> List[Dict[str, Any]]:
+        """Return the waits that consumed the most of the budget."""
+        self._close_last_wait(time.perf_counter())
+        return sorted(self.waits, key=lambda wait: wait["used_ms"] or 0, reverse=True)[:limit]
+
+    def summary(self) -> str:
+        """One-line description of where the budget went."""
+        top = ", ".join(f"{wait['label']} {wait['used_ms']} ms" for wait in self.top_waits())
+        return (f"Used {self.elapsed_ms():.0f} of {self.budget_ms} ms over {len(self.waits)} waits"
+                + (f"; largest: {top}" if top else ""))
+
+
+_current: Optional[Deadline] = None
+
+
+def start_deadline(budget_ms: int, name: str = "test") -> Deadline:
+    """Start the budget every page-object wait in this process draws from."""
+    global _current
+    _current = Deadline(budget_ms, name)
+    return _current
+
+
+def clear_deadline():
+    global _current
+    _current = None
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current
+
+
+def budget_timeout(own_timeout_ms: float, label: str) -> float:
+    """min(own timeout, remaining budget), or the own timeout when no deadline is active."""
+    if _current is None:
+        return own_timeout_ms
+    return _current.timeout(own_timeout_ms, label)
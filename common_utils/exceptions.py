@@ -26,4 +26,13 @@ class DownloadError(AutomationError):
 
 class CalculationError(AutomationError):
     def __init__(self, message:str ,error_code: str ="CALCULATION_FALIED"):
-        super().__init__(message, error_code)
\ No newline at end of file
+        super().__init__(message, error_code)
+
+class ConfigError(AutomationError):
+    def __init__(self, message: str, error_code: str = "CONFIG_INVALID"):
+        super().__init__(message, error_code)
+
+
+class DeadlineExceededError(AutomationError):
+    def __init__(self, message: str, error_code: str = "DEADLINE_EXCEEDED"):
+        super().__init__(message, error_code)
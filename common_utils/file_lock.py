@@ -0,0 +1,100 @@
+import os
+import json
+import time
+import socket
+import logging
+import threading
+
+
+class FileLock:
+    """
+    Cross-process lock backed by an exclusively created lock file.
+    The file records the owner's PID and host, and the owner refreshes its mtime as a heartbeat
+    while it holds the lock, so a slow but live owner is never mistaken for a dead one.
+    """
+
+    def __init__(self, path: str, timeout: float = 600, stale_after: float = 60, poll_interval: float = 0.2,
+                 heartbeat_interval: float = None):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval or stale_after / 4
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._fd = None
+        self._heartbeat = None
+        self._stop = threading.Event()
+
+    def _owner(self):
+        """PID and host recorded in the lock file, or None if it cannot be read."""
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _is_stale(self) -> bool:
+        """True if the owner died (same host) or stopped sending heartbeats for `stale_after` seconds."""
+        owner = self._owner()
+        if owner and owner.get("host") == socket.gethostname() and os.name == "posix":
+            try:
+                os.kill(owner["pid"], 0)
+            except ProcessLookupError:
+                self.logger.warning(f"Lock owner {owner['pid']} is gone")
+                return True
+            except (PermissionError, KeyError, TypeError):
+                pass
+        return time.time() - os.path.getmtime(self.path) > self.stale_after
+
+    def _beat(self):
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                os.utime(self.path)
+            except FileNotFoundError:
+                return
+
+    def acquire(self):
+        """Block until the lock file can be created, breaking locks left behind by dead processes."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        start_time = time.time()
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, json.dumps({"pid": os.getpid(), "host": socket.gethostname()}).encode("utf-8"))
+                self._stop.clear()
+                self._heartbeat = threading.Thread(target=self._beat, name=f"lock-heartbeat:{self.path}", daemon=True)
+                self._heartbeat.start()
+                return
+            except FileExistsError:
+                try:
+                    if self._is_stale():
+                        self.logger.warning(f"Removing stale lock file: {self.path}")
+                        os.remove(self.path)
+                        continue
+                except FileNotFoundError:
+                    continue
+
+                if time.time() - start_time > self.timeout:
+                    raise TimeoutError(f"Could not acquire lock {self.path} within {self.timeout}s")
+                time.sleep(self.poll_interval)
+
+    def release(self):
+        """Release the lock if this process holds it."""
+        if self._fd is None:
+            return
+        self._stop.set()
+        self._heartbeat.join()
+        self._heartbeat = None
+        os.close(self._fd)
+        self._fd = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
@@ -0,0 +1,69 @@
+import os
+import re
+import json
+import time
+import logging
+from typing import Dict, Any, List, Optional
+
+
+class FilterCatalog:
+    """
+    Option lists of the dashboard filter dropdowns for one app version, cached on disk so
+    filter cases naming a branch/DSR/LOB/tier that no longer exists can be skipped up front.
+    """
+
+    # Fields whose options depend on another field (the DSR list depends on the branch);
+    # only their unfiltered lists are discovered, so they are not validated when the parent is set
+    DEPENDENT_FIELDS = {"dsr": "branch"}
+
+    def __init__(self, options: Dict[str, List[str]], app_version: str, discovered_at: float = None):
+        self.options = options
+        self.app_version = app_version
+        self.discovered_at = discovered_at or time.time()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def cache_path(app_version: str, cache_dir: str = None) -> str:
+        cache_dir = cache_dir or os.getenv("FILTER_CATALOG_DIR", ".cache")
+        safe_version = re.sub(r"[^A-Za-z0-9._-]", "_", str(app_version))
+        return os.path.join(cache_dir, f"filter_options_{safe_version}.json")
+
+    @classmethod
+    def load(cls, app_version: str, cache_dir: str = None) -> Optional["FilterCatalog"]:
+        """Return the cached catalog for `app_version`, or None if it has not been discovered yet."""
+        if not app_version or app_version == "unknown":
+            return None
+        try:
+            with open(cls.cache_path(app_version, cache_dir), 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return cls(data["options"], data["app_version"], data.get("discovered_at"))
+
+    def save(self, cache_dir: str = None) -> Optional[str]:
+        """Persist the catalog; skipped when the app version is unknown."""
+        if not self.app_version or self.app_version == "unknown":
+            return None
+        path = self.cache_path(self.app_version, cache_dir)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({"app_version": self.app_version, "discovered_at": self.discovered_at,
+                       "options": self.options}, f, indent=4)
+        self.logger.info(f"Saved filter options for version {self.app_version} to {path}")
+        return path
+
+    def validate(self, case: Dict[str, Any]) -> Optional[str]:
+        """Return why `case` can never be applied, or None if every value is an existing option."""
+        problems = []
+        for field, value in case.items():
+            if not value or field not in self.options:
+                continue
+            if case.get(self.DEPENDENT_FIELDS.get(field)):
+                continue
+            if " ".join(str(value).split()) not in self.options[field]:
+                problems.append(f"{field}='{value}'")
+
+        if problems:
+            return (f"Filter values not offered by the app (version {self.app_version}): "
+                    f"{', '.join(problems)}")
+        return None
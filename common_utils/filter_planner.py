@@ -0,0 +1,69 @@
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class FilterPlanner:
+    """
+    Orders dashboard filter cases so consecutive cases differ in as few dropdowns as possible.
+    Fields can only be changed, not cleared: a case that leaves out a field the current state
+    has set needs a page reload first, which is priced as RESET_COST dropdown changes.
+    """
+
+    FIELDS = ("branch", "dsr", "lob", "tier")
+    # Changing a parent filter reloads the options of (and clears) its dependents
+    DEPENDENTS = {"branch": ("dsr",)}
+    RESET_COST = 5
+
+    def __init__(self, reset_cost: int = None):
+        self.reset_cost = self.RESET_COST if reset_cost is None else reset_cost
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def normalize(cls, case: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Keep only the filter fields that carry a value."""
+        return {field: case[field] for field in cls.FIELDS if case and case.get(field)}
+
+    @classmethod
+    def transition(cls, current: Dict[str, Any], target: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Return (needs_reset, changes) to go from filter state `current` to `target`.
+        After a reset every field of `target` has to be set.
+        """
+        current, target = cls.normalize(current), cls.normalize(target)
+        if any(field not in target for field in current):
+            return True, target
+
+        changes = {field: value for field, value in target.items() if current.get(field) != value}
+        for parent, dependents in cls.DEPENDENTS.items():
+            if parent in changes:
+                changes.update({field: target[field] for field in dependents if field in target})
+        return False, {field: changes[field] for field in cls.FIELDS if field in changes}
+
+    def cost(self, current: Dict[str, Any], target: Dict[str, Any]) -> int:
+        needs_reset, changes = self.transition(current, target)
+        return len(changes) + (self.reset_cost if needs_reset else 0)
+
+    def order(self, cases: List[Dict[str, Any]], start: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Greedy nearest-neighbour ordering starting from `start` (default: unfiltered).
+        Ties keep the original order, so an already good order is left alone.
+        """
+        remaining = list(enumerate(cases))
+        state = self.normalize(start)
+        ordered = []
+        while remaining:
+            index, case = min(remaining, key=lambda item: (self.cost(state, item[1]), item[0]))
+            remaining.remove((index, case))
+            ordered.append(case)
+            state = self.normalize(case)
+        return ordered
+
+    def summary(self, cases: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Planned dropdown changes and resets for `cases` in the given order."""
+        state, changes, resets = {}, 0, 0
+        for case in cases:
+            needs_reset, diff = self.transition(state, case)
+            resets += needs_reset
+            changes += len(diff)
+            state = self.normalize(case)
+        return {"cases": len(cases), "dropdown_changes": changes, "resets": resets}
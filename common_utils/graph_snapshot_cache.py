@@ -0,0 +1,68 @@
+import os
+import copy
+import time
+import logging
+from typing import Dict, Any, Callable, Optional, Tuple
+
+from common_utils.filter_planner import FilterPlanner
+
+
+class GraphSnapshotCache:
+    """
+    Session-wide cache of graph data keyed by app version and normalized filter state,
+    so a baseline such as the unfiltered dashboard is scraped once and compared against
+    by every test. Entries expire after `ttl` seconds, when the app version changes or when
+    invalidated explicitly.
+    """
+
+    def __init__(self, app_version: str = "unknown", ttl: float = None):
+        self.app_version = app_version
+        self.ttl = ttl if ttl is not None else float(os.getenv("GRAPH_SNAPSHOT_TTL", "1800"))
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._entries: Dict[Tuple, Dict[str, Any]] = {}
+        self.counters = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def key(self, filters: Optional[Dict[str, Any]] = None) -> Tuple:
+        """Cache key for a filter state; empty values and field order do not matter."""
+        return (self.app_version,) + tuple(
+            (field, " ".join(str(value).split())) for field, value in FilterPlanner.normalize(filters).items()
+        )
+
+    def get(self, filters: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached snapshot for `filters`, or None if missing or expired."""
+        entry = self._entries.get(self.key(filters))
+        if entry is None or time.time() - entry["captured_at"] > self.ttl:
+            self.counters["misses"] += 1
+            return None
+        self.counters["hits"] += 1
+        return copy.deepcopy(entry["data"])
+
+    def put(self, filters: Optional[Dict[str, Any]], data: Dict[str, Any]):
+        self._entries[self.key(filters)] = {"data": copy.deepcopy(data), "captured_at": time.time()}
+
+    def get_or_capture(self, filters: Optional[Dict[str, Any]], capture: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the cached snapshot for `filters`, calling `capture()` to fill it on a miss."""
+        data = self.get(filters)
+        if data is None:
+            data = capture()
+            self.put(filters, data)
+            self.logger.info(f"Captured graph snapshot for {self.key(filters)[1:] or 'unfiltered'}")
+        return data
+
+    def invalidate(self, filters: Optional[Dict[str, Any]] = None):
+        """Drop one filter state, or everything when `filters` is None (e.g. after data was changed)."""
+        if filters is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(self.key(filters), None)
+        self.counters["invalidations"] += 1
+
+    def set_app_version(self, app_version: str):
+        """Switch to `app_version`, dropping every snapshot taken against another version."""
+        if app_version and app_version != self.app_version:
+            self.logger.info(f"App version changed {self.app_version} -> {app_version}; dropping graph snapshots")
+            self.invalidate()
+            self.app_version = app_version
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "entries": len(self._entries)}
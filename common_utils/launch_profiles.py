@@ -0,0 +1,51 @@
+import os
+from typing import Dict, Any
+
+# Named browser launch profiles, selected with --launch-profile or LAUNCH_PROFILE
+LAUNCH_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {
+        "headless": False,
+        "args": [],
+        "slow_mo": 0,
+        "viewport": {"width": 1280, "height": 720},
+        "device_scale_factor": 1,
+    },
+    "ci": {
+        "headless": True,
+        "args": ["--disable-dev-shm-usage", "--no-sandbox", "--disable-gpu"],
+        "slow_mo": 0,
+        "viewport": {"width": 1280, "height": 720},
+        "device_scale_factor": 1,
+    },
+    "debug": {
+        "headless": False,
+        "args": ["--auto-open-devtools-for-tabs"],
+        "slow_mo": 250,
+        "viewport": {"width": 1600, "height": 900},
+        "device_scale_factor": 1,
+    },
+    "perf": {
+        "headless": True,
+        "args": [
+            "--disable-dev-shm-usage",
+            "--disable-extensions",
+            "--disable-background-timer-throttling",
+            "--disable-backgrounding-occluded-windows",
+            "--disable-renderer-backgrounding",
+        ],
+        "slow_mo": 0,
+        "viewport": {"width": 1280, "height": 720},
+        "device_scale_factor": 1,
+    },
+}
+
+
+def get_launch_profile(name: str = None) -> Dict[str, Any]:
+    """
+    Resolve a launch profile by name, falling back to LAUNCH_PROFILE and then to
+    `ci` when the CI env var is set, otherwise `default`.
+    """
+    name = name or os.getenv("LAUNCH_PROFILE") or ("ci" if os.getenv("CI") else "default")
+    if name not in LAUNCH_PROFILES:
+        raise ValueError(f"Unknown launch profile '{name}'. Choose from: {', '.join(LAUNCH_PROFILES)}")
+    return {"name": name, **LAUNCH_PROFILES[name]}
@@ -0,0 +1,68 @@
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class NavigationPlanner:
+    """
+    Plans the menu clicks for a list of reports_navigation.json entries.
+    The dashboard menu is modelled as report sections that expand to show their views:
+    entries are grouped by section (in order of first appearance), a section that is
+    already expanded is not clicked again and the view that is already open is not re-opened.
+    """
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = list(entries)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def _route(entry: Dict[str, Any]) -> Tuple[str, str]:
+        return entry["navigation"]["report"], entry["navigation"]["view"]
+
+    def groups(self) -> List[List[Dict[str, Any]]]:
+        """One list of entries per section (in order of first appearance), keeping file order inside each."""
+        sections = OrderedDict()
+        for entry in self.entries:
+            sections.setdefault(self._route(entry)[0], []).append(entry)
+        return list(sections.values())
+
+    def ordered(self) -> List[Dict[str, Any]]:
+        """Entries grouped by section, keeping file order inside each section."""
+        return [entry for group in self.groups() for entry in group]
+
+    @staticmethod
+    def transition(state: Optional[Dict[str, Any]], entry: Dict[str, Any]) -> Dict[str, bool]:
+        """
+        Clicks needed to reach `entry` from menu `state` ({"section", "view"} or None when unknown).
+        A report whose view is its own button (e.g. SPANCOP Movement) is a single click.
+        """
+        report, view = NavigationPlanner._route(entry)
+        state = state or {}
+        if state.get("section") == report and state.get("view") == view:
+            return {"open_section": False, "open_view": False}
+        open_section = state.get("section") != report
+        return {"open_section": open_section, "open_view": view != report or not open_section}
+
+    def plan(self) -> List[Dict[str, Any]]:
+        """Return one step per entry: the entry plus which clicks it needs."""
+        steps, state = [], None
+        for entry in self.ordered():
+            steps.append({"entry": entry, **self.transition(state, entry)})
+            report, view = self._route(entry)
+            state = {"section": report, "view": view}
+        return steps
+
+    @staticmethod
+    def clicks(step: Dict[str, Any]) -> int:
+        return int(step["open_section"]) + int(step["open_view"])
+
+    def summary(self) -> Dict[str, int]:
+        """Planned against naive (section + view click for every entry) click counts."""
+        naive_clicks = sum(1 if view == report else 2 for report, view in map(self._route, self.entries))
+        planned_clicks = sum(self.clicks(step) for step in self.plan())
+        return {
+            "entries": len(self.entries),
+            "naive_clicks": naive_clicks,
+            "planned_clicks": planned_clicks,
+            "clicks_saved": naive_clicks - planned_clicks,
+        }
@@ -0,0 +1,111 @@
+import os
+import re
+import time
+import logging
+import weakref
+from collections import deque
+from typing import List, Optional
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+class NetworkTracker:
+    """
+    Counts in-flight requests on a page that match include/exclude URL patterns, so waits can
+    end as soon as the requests we care about are done instead of waiting for `networkidle`
+    (which analytics beacons and long-polling keep from ever settling).
+    """
+
+    # Requests that never matter for page readiness
+    DEFAULT_EXCLUDE = [
+        r"google-analytics\.com", r"googletagmanager\.com", r"doubleclick\.net", r"hotjar\.",
+        r"clarity\.ms", r"sentry\.io", r"nr-data\.net", r"segment\.(io|com)", r"mixpanel\.com",
+        r"/socket\.io/", r"/sockjs", r"longpoll", r"/heartbeat",
+    ]
+    # Only these resource types are considered data the page waits on
+    TRACKED_RESOURCE_TYPES = {"document", "xhr", "fetch"}
+
+    _trackers = weakref.WeakKeyDictionary()
+
+    def __init__(self, page, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None):
+        self.page = page
+        self.include = self._compile(include if include is not None else self._env_patterns("NETWORK_QUIET_INCLUDE"))
+        self.exclude = self._compile(exclude if exclude is not None
+                                     else self.DEFAULT_EXCLUDE + self._env_patterns("NETWORK_QUIET_EXCLUDE"))
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._in_flight = {}
+        self._finished = deque(maxlen=500)
+
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+
+    @classmethod
+    def for_page(cls, page) -> "NetworkTracker":
+        """Return the tracker attached to `page`, attaching one on first use."""
+        tracker = cls._trackers.get(page)
+        if tracker is None:
+            tracker = cls(page)
+            cls._trackers[page] = tracker
+        return tracker
+
+    @staticmethod
+    def _env_patterns(name: str) -> List[str]:
+        return [pattern.strip() for pattern in os.getenv(name, "").split(",") if pattern.strip()]
+
+    @staticmethod
+    def _compile(patterns: List[str]):
+        return [re.compile(pattern) for pattern in patterns]
+
+    def _on_request(self, request):
+        if request.resource_type in self.TRACKED_RESOURCE_TYPES:
+            self._in_flight[request] = request.url
+
+    def _on_request_done(self, request):
+        url = self._in_flight.pop(request, None)
+        if url is not None:
+            self._finished.append((time.perf_counter(), url))
+
+    def _matches(self, url: str, include) -> bool:
+        if any(pattern.search(url) for pattern in self.exclude):
+            return False
+        return not include or any(pattern.search(url) for pattern in include)
+
+    def in_flight(self, patterns: Optional[List[str]] = None) -> List[str]:
+        """URLs of matching requests that have not finished yet."""
+        include = self._compile(patterns) if patterns else self.include
+        return [url for url in self._in_flight.values() if self._matches(url, include)]
+
+    def last_finished(self) -> Optional[float]:
+        """perf_counter() time at which the last matching request finished, if any."""
+        return max((done for done, url in self._finished if self._matches(url, self.include)), default=None)
+
+    def wait_for_quiet(self, patterns: Optional[List[str]] = None, quiet_ms: int = None,
+                       timeout: float = 10000, poll_ms: int = 50) -> float:
+        """
+        Wait until no matching request has been in flight for `quiet_ms`.
+        `patterns` (regexes) replace the tracker's include list for this call.
+        Returns the time waited in ms; raises a Playwright TimeoutError listing what is still pending.
+        """
+        quiet_ms = quiet_ms if quiet_ms is not None else int(os.getenv("NETWORK_QUIET_MS", "500"))
+        include = self._compile(patterns) if patterns else self.include
+        start_time = time.perf_counter()
+        deadline = start_time + timeout / 1000
+
+        while True:
+            now = time.perf_counter()
+            pending = [url for url in self._in_flight.values() if self._matches(url, include)]
+            if not pending:
+                last_done = max((done for done, url in self._finished if self._matches(url, include)),
+                                default=start_time)
+                quiet_for = (now - max(last_done, start_time)) * 1000
+                if quiet_for >= quiet_ms:
+                    return round((now - start_time) * 1000, 1)
+
+            if now >= deadline:
+                raise PlaywrightTimeoutError(
+                    f"Network not quiet after {timeout} ms; still pending: {pending[:5]}"
+                )
+            # wait_for_timeout lets Playwright dispatch the request events we are counting
+            self.page.wait_for_timeout(poll_ms)
@@ -0,0 +1,86 @@
+import time
+import logging
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List
+
+import requests
+import urllib3
+
+
+class PreflightCheck:
+    """Probe the UI, the API host and the version endpoint in parallel before any browser starts."""
+
+    VERSION_ENDPOINT = "user/fetchLatestVersion"
+
+    def __init__(self, ui_url: str, api_base_url: str, timeout: float = 5.0, verify_tls: bool = False):
+        self.ui_url = ui_url
+        self.api_base_url = api_base_url
+        self.timeout = timeout
+        self.verify_tls = verify_tls
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _probe(self, name: str, method: str, url: str) -> Dict[str, Any]:
+        """Send one request and report status, latency and what (if anything) is wrong."""
+        result = {"name": name, "url": url, "ok": False, "status": None, "latency_ms": None, "error": None}
+        start_time = time.perf_counter()
+        try:
+            response = requests.request(
+                method, url,
+                json={} if method == "POST" else None,
+                timeout=self.timeout,
+                verify=self.verify_tls
+            )
+        except requests.RequestException as e:
+            result["error"] = f"{type(e).__name__}: {str(e)}"
+            return result
+        finally:
+            result["latency_ms"] = round((time.perf_counter() - start_time) * 1000, 1)
+
+        result["status"] = response.status_code
+        if response.status_code >= 500:
+            result["error"] = f"server error {response.status_code}"
+            return result
+
+        if name == "version":
+            try:
+                body = response.json()
+                result["version"] = body["data"][0]["version"]
+            except Exception:
+                result["error"] = f"unexpected version response (status {response.status_code})"
+                return result
+
+        result["ok"] = True
+        return result
+
+    def run(self) -> Dict[str, Any]:
+        """Run all probes concurrently; the slowest probe bounds the total time."""
+        probes = [
+            ("ui", "GET", self.ui_url),
+            ("api", "GET", self.api_base_url),
+            ("version", "POST", urljoin(self.api_base_url.rstrip('/') + '/', self.VERSION_ENDPOINT)),
+        ]
+
+        if not self.verify_tls:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            results: List[Dict[str, Any]] = list(executor.map(lambda probe: self._probe(*probe), probes))
+
+        report = {
+            "healthy": all(result["ok"] for result in results),
+            "probes": results,
+            "app_version": next((r.get("version") for r in results if r.get("version")), None),
+        }
+        self.logger.info(f"Preflight: {report}")
+        return report
+
+    @staticmethod
+    def diagnose(report: Dict[str, Any]) -> str:
+        """Human-readable summary of failed probes."""
+        lines = ["Target environment is unhealthy, aborting the session:"]
+        for result in report["probes"]:
+            state = "OK" if result["ok"] else f"FAILED ({result['error']})"
+            lines.append(f"  {result['name']:<8} {result['url']} -> {state} in {result['latency_ms']} ms")
+        lines.append("Set PREFLIGHT=0 or pass --skip-preflight to run anyway.")
+        return "\n".join(lines)
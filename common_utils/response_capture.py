@@ -0,0 +1,96 @@
+import re
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, TypedDict
+
+
+class CapturedResponse(TypedDict):
+    """Parsed JSON payload of one response captured for a named graph."""
+    name: str
+    url: str
+    status: int
+    payload: Any
+    received_ms: float
+
+
+class ResponseCapture:
+    """
+    Records JSON responses whose URL matches registered patterns while an action runs,
+    so assertions can use the exact numbers the page was given instead of rendered text.
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.patterns: Dict[str, re.Pattern] = {}
+        self.data: Dict[str, CapturedResponse] = {}
+        self.unmatched_urls: List[str] = []
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._pending = []
+
+    def register(self, name: str, pattern: str):
+        """Capture responses whose URL matches the regex `pattern` under `name`."""
+        self.patterns[name] = re.compile(pattern)
+
+    def _on_response(self, response):
+        # Only remember the response here; parsing happens outside the event handler
+        if response.request.resource_type not in ("xhr", "fetch"):
+            return
+        self._pending.append((time.perf_counter(), response))
+
+    @contextmanager
+    def capture(self, names: Optional[List[str]] = None, timeout: float = 30000):
+        """
+        Record matching responses triggered inside the `with` block, then wait (up to `timeout`)
+        until every name in `names` (default: all registered) has received one.
+        """
+        names = names or list(self.patterns)
+        self.data = {}
+        self.unmatched_urls = []
+        self._pending = []
+        start_time = time.perf_counter()
+
+        self.page.on("response", self._on_response)
+        try:
+            yield self
+            deadline = start_time + timeout / 1000
+            while not self._collect(names, start_time) and time.perf_counter() < deadline:
+                self.page.wait_for_timeout(50)
+        finally:
+            self.page.remove_listener("response", self._on_response)
+
+        missing = [name for name in names if name not in self.data]
+        if not self.patterns:
+            # Nothing configured yet: list the JSON endpoints so patterns can be written for them
+            self.logger.info(f"No response patterns registered; JSON responses seen: {self.unmatched_urls[:10]}")
+        elif missing:
+            self.logger.warning(
+                f"No response captured for {missing}; JSON responses seen: {self.unmatched_urls[:10]}"
+            )
+
+    def _collect(self, names: List[str], start_time: float) -> bool:
+        """Parse newly arrived responses; True once every name has a payload."""
+        pending, self._pending = self._pending, []
+        for received_at, response in pending:
+            matched = [name for name, pattern in self.patterns.items() if pattern.search(response.url)]
+            if not matched:
+                if "json" in response.headers.get("content-type", ""):
+                    self.unmatched_urls.append(response.url)
+                continue
+            try:
+                payload = response.json()
+            except Exception as e:
+                self.logger.warning(f"Response from {response.url} is not JSON: {str(e)}")
+                continue
+            for name in matched:
+                self.data[name] = CapturedResponse(
+                    name=name,
+                    url=response.url,
+                    status=response.status,
+                    payload=payload,
+                    received_ms=round((received_at - start_time) * 1000, 1),
+                )
+        return all(name in self.data for name in names)
+
+    def get(self, name: str) -> Optional[CapturedResponse]:
+        return self.data.get(name)
@@ -0,0 +1,74 @@
+import os
+import re
+import json
+import logging
+from typing import Dict, Any, Optional
+
+from common_utils.file_lock import FileLock
+
+
+class RouteCache:
+    """
+    Hash-route URLs reached for each (report, view) menu locator pair, persisted per app
+    version so later visits can `goto` the view instead of clicking through the menu.
+    """
+
+    def __init__(self, app_version: str = "unknown", cache_dir: str = None):
+        cache_dir = cache_dir or os.getenv("ROUTE_CACHE_DIR", ".cache")
+        safe_version = re.sub(r"[^A-Za-z0-9._-]", "_", str(app_version))
+        self.path = os.path.join(cache_dir, f"routes_{safe_version}.json")
+        self.lock = FileLock(f"{self.path}.lock")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.counters = {"hits": 0, "misses": 0, "recorded": 0, "stale": 0}
+        self._routes: Dict[str, str] = self._read()
+
+    @staticmethod
+    def key(report: str, view: str) -> str:
+        return f"{report}|{view}"
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _update(self, key: str, url: Optional[str]):
+        """Merge one change into the file under the lock so parallel workers keep each other's routes."""
+        with self.lock:
+            routes = self._read()
+            if url is None:
+                routes.pop(key, None)
+            else:
+                routes[key] = url
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(routes, f, indent=4)
+            os.replace(tmp_path, self.path)
+        self._routes = routes
+
+    def get(self, report: str, view: str) -> Optional[str]:
+        url = self._routes.get(self.key(report, view))
+        self.counters["hits" if url else "misses"] += 1
+        return url
+
+    def peek(self, report: str, view: str) -> Optional[str]:
+        """Look up a route without counting it as a hit or miss (e.g. to prefetch it)."""
+        return self._routes.get(self.key(report, view))
+
+    def put(self, report: str, view: str, url: str):
+        """Record the URL a click navigation ended on; only hash routes can be deep-linked."""
+        if "#/" not in url or self._routes.get(self.key(report, view)) == url:
+            return
+        self._update(self.key(report, view), url)
+        self.counters["recorded"] += 1
+        self.logger.info(f"Recorded route {report} > {view}: {url}")
+
+    def forget(self, report: str, view: str):
+        """Drop a route that no longer resolves."""
+        self._update(self.key(report, view), None)
+        self.counters["stale"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "routes": len(self._routes)}
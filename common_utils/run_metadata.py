@@ -0,0 +1,40 @@
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Any
+
+
+class RunMetadata:
+    """Collects per-run measurements (startup times, pool stats, ...) and writes them to reports/."""
+
+    def __init__(self):
+        self.data: Dict[str, Any] = {"started_at": datetime.now().isoformat()}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def record(self, section: str, values: Dict[str, Any]):
+        """Merge `values` into a named section of the run metadata."""
+        self.data.setdefault(section, {}).update(values)
+
+    def increment(self, section: str, key: str, amount: float = 1):
+        """Add `amount` to a running total inside a section."""
+        values = self.data.setdefault(section, {})
+        values[key] = round(values.get(key, 0) + amount, 1)
+
+    def dump(self, report_dir: str = "reports") -> str:
+        """Write the collected metadata as JSON, one file per xdist worker."""
+        os.makedirs(report_dir, exist_ok=True)
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        file_name = f"run_metadata_{worker}.json" if worker else "run_metadata.json"
+        path = os.path.join(report_dir, file_name)
+
+        self.data["finished_at"] = datetime.now().isoformat()
+        with open(path, 'w') as f:
+            json.dump(self.data, f, indent=4, default=str)
+
+        self.logger.info(f"Run metadata written to {path}")
+        return path
+
+
+# Process-wide instance shared by fixtures and hooks
+run_metadata = RunMetadata()
@@ -0,0 +1,72 @@
+import os
+import json
+import time
+import hashlib
+import logging
+from typing import Dict, Any, Optional
+
+from common_utils.file_lock import FileLock
+
+
+class SessionCache:
+    """Persist an authenticated browser storage state so sessions and workers can skip the UI login."""
+
+    def __init__(self, key: str, cache_dir: str = None, ttl: int = None):
+        self.cache_dir = cache_dir or os.getenv("AUTH_STATE_DIR", ".auth")
+        self.ttl = ttl if ttl is not None else int(os.getenv("AUTH_STATE_TTL", "3600"))
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        self.state_path = os.path.join(self.cache_dir, f"storage_state_{digest}.json")
+        self.meta_path = os.path.join(self.cache_dir, f"storage_state_{digest}.meta.json")
+        self.lock = FileLock(os.path.join(self.cache_dir, f"storage_state_{digest}.lock"))
+
+    @property
+    def enabled(self) -> bool:
+        """A TTL of 0 (or less) disables the cache: nothing is read or written."""
+        return self.ttl > 0
+
+    def is_fresh(self) -> bool:
+        """Return True if a cached storage state exists and is younger than the TTL."""
+        if not self.enabled or not os.path.exists(self.state_path):
+            return False
+
+        age = time.time() - os.path.getmtime(self.state_path)
+        if age > self.ttl:
+            self.logger.info(f"Cached storage state expired ({age:.0f}s old, ttl {self.ttl}s)")
+            return False
+        return True
+
+    def load_meta(self) -> Dict[str, Any]:
+        """Return metadata saved next to the storage state (landing URL, save time)."""
+        if not self.enabled:
+            return {}
+        try:
+            with open(self.meta_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self, context, landing_url: Optional[str] = None):
+        """Write the context's storage state atomically and record where the login landed."""
+        if not self.enabled:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        context.storage_state(path=tmp_path)
+        os.replace(tmp_path, self.state_path)
+
+        with open(self.meta_path, 'w') as f:
+            json.dump({"landing_url": landing_url, "saved_at": time.time()}, f, indent=4)
+
+        self.logger.info(f"Saved storage state to {self.state_path}")
+
+    def invalidate(self):
+        """Remove the cached storage state so the next session logs in again."""
+        for path in (self.state_path, self.meta_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.logger.info(f"Invalidated storage state {self.state_path}")
@@ -0,0 +1,112 @@
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from common_utils.network_tracker import NetworkTracker
+
+
+class ViewPrefetcher:
+    """
+    Opens the next expected view in a background page of the same (authenticated) context
+    while the current step is still working, and hands that page over when the step asks
+    for the same URL. Wrong guesses are closed; at most `max_pages` are held at once.
+    """
+
+    def __init__(self, context, max_pages: int = 1, ready_timeout: float = 30000):
+        self.context = context
+        self.max_pages = max_pages
+        self.ready_timeout = ready_timeout
+        self.logger = logging.getLogger(self.__class__.__name__)
+        # url -> (page, started_at)
+        self._pending: "OrderedDict[str, tuple]" = OrderedDict()
+        self.counters = {"prefetched": 0, "hits": 0, "misses": 0, "discarded": 0, "start_failures": 0, "unusable": 0}
+        self._hidden_ms = []
+        self._waited_ms = []
+
+    def prefetch(self, url: str):
+        """Start loading `url` in a new background page without waiting for it."""
+        if not url or url in self._pending:
+            return
+        while len(self._pending) >= self.max_pages:
+            self._discard(next(iter(self._pending)))
+
+        page = self.context.new_page()
+        # Attach the tracker before navigating so take() sees every request of the load
+        NetworkTracker.for_page(page)
+        try:
+            # Assigning location.href returns at once, unlike goto which blocks until load
+            page.evaluate("url => { window.location.href = url; }", url)
+        except Exception as e:
+            self.logger.warning(f"Could not start prefetch of {url}: {str(e)}")
+            self.counters["start_failures"] += 1
+            page.close()
+            return
+        self._pending[url] = (page, time.perf_counter())
+        self.counters["prefetched"] += 1
+        self.logger.info(f"Prefetching {url}")
+
+    def take(self, url: str):
+        """
+        Return the prefetched page for `url` once it is ready, or None on a miss.
+        Pages prefetched for any other URL are discarded as wrong guesses.
+        """
+        for other in [pending for pending in self._pending if pending != url]:
+            self._discard(other)
+
+        if url not in self._pending:
+            self.counters["misses"] += 1
+            return None
+
+        page, started_at = self._pending.pop(url)
+        take_start = time.perf_counter()
+        try:
+            page.wait_for_load_state("domcontentloaded", timeout=self.ready_timeout)
+            NetworkTracker.for_page(page).wait_for_quiet(timeout=self.ready_timeout)
+            if page.url != url:
+                raise ValueError(f"prefetch redirected to {page.url}")
+        except Exception as e:
+            self.logger.warning(f"Prefetched page for {url} not usable: {str(e)}")
+            self.counters["unusable"] += 1
+            page.close()
+            return None
+
+        self.counters["hits"] += 1
+        # Loading that overlapped with the previous step is the latency hidden from this one
+        loaded_at = NetworkTracker.for_page(page).last_finished() or take_start
+        self._hidden_ms.append((min(take_start, loaded_at) - started_at) * 1000)
+        self._waited_ms.append((time.perf_counter() - take_start) * 1000)
+        return page
+
+    def _discard(self, url: str):
+        page, _ = self._pending.pop(url)
+        self.counters["discarded"] += 1
+        try:
+            page.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """Close every page still being prefetched."""
+        for url in list(self._pending):
+            self._discard(url)
+
+    @classmethod
+    def combined_stats(cls, prefetchers) -> Dict[str, Any]:
+        """Stats of several prefetchers (e.g. one per download tab) as if they were one."""
+        combined = cls(None)
+        for prefetcher in prefetchers:
+            for name, value in prefetcher.counters.items():
+                combined.counters[name] += value
+            combined._hidden_ms.extend(prefetcher._hidden_ms)
+            combined._waited_ms.extend(prefetcher._waited_ms)
+        return combined.stats()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.counters["hits"] + self.counters["misses"] + self.counters["unusable"]
+        return {
+            **self.counters,
+            "hit_rate": round(self.counters["hits"] / lookups, 2) if lookups else 0.0,
+            "latency_hidden_ms": round(sum(self._hidden_ms), 1),
+            "avg_wait_on_take_ms": round(sum(self._waited_ms) / len(self._waited_ms), 1) if self._waited_ms else 0.0,
+        }
@@ -3,6 +3,7 @@ import subprocess
 import sys
 import os
 import json
+import time
 import pytest
 import logging
 from dotenv import load_dotenv
@@ -10,34 +11,54 @@ from playwright.sync_api import sync_playwright, Page, Browser, APIRequestContex
 
 # Import page objects
 from pages.login.login_page import LoginPage
+from pages.api.auth_api_client import AuthAPIClient
+from pages.api.session_manager import AuthSessionManager
+from common_utils.session_cache import SessionCache
+from common_utils.context_pool import BrowserContextPool
+from common_utils.credential_pool import CredentialPool
+from common_utils.launch_profiles import LAUNCH_PROFILES, get_launch_profile
+from common_utils.run_metadata import run_metadata
+from common_utils.config import ConfigService
+from common_utils.preflight import PreflightCheck
+from common_utils.deadline import start_deadline, clear_deadline
+from common_utils.filter_catalog import FilterCatalog
+from common_utils.filter_planner import FilterPlanner
+from common_utils.graph_snapshot_cache import GraphSnapshotCache
+from common_utils.route_cache import RouteCache
 
 load_dotenv()
 
 # ------------------- #
-# Utility functions
+# Command line options
 # ------------------- #
-def load_json_config(path: str, create_dirs: bool = False) -> dict:
-    """
-    Generic JSON loader for config files.
-    Args:
-        path (str): Path to the JSON file.
-        create_dirs (bool): Whether to create parent directories if missing (default False).
-    Returns:
-        dict: Parsed JSON content or empty dict if error.
-    """
-    try:
-        if create_dirs:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-
-        if os.path.exists(path):
-            with open(path, 'r') as f:
-                return json.load(f)
-        else:
-            logging.warning(f"Config file not found: {path}")
-            return {}
-    except Exception as e:
-        logging.error(f"Error loading config from {path}: {str(e)}")
-        return {}
+def pytest_addoption(parser):
+    """Register custom command line options"""
+    parser.addoption(
+        "--launch-profile",
+        action="store",
+        default=None,
+        choices=sorted(LAUNCH_PROFILES),
+        help="Browser launch profile (default: LAUNCH_PROFILE env, 'ci' on CI, else 'default')"
+    )
+    parser.addoption(
+        "--skip-preflight",
+        action="store_true",
+        default=False,
+        help="Do not probe the target environment before the session starts"
+    )
+    parser.addoption(
+        "--test-deadline",
+        action="store",
+        type=float,
+        default=None,
+        help="Per-test time budget in seconds shared by all page-object waits (default: TEST_DEADLINE env)"
+    )
+    parser.addoption(
+        "--prefetch-views",
+        action="store_true",
+        default=False,
+        help="Load the next planned dashboard view in a background tab (default: PREFETCH_VIEWS env)"
+    )
 
 # ------------------- #
 # Test Markers Configuration
@@ -49,49 +70,82 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "integration: Integration tests (UI + API)")
     config.addinivalue_line("markers", "smoke: Smoke tests")
     config.addinivalue_line("markers", "regression: Regression tests")
+    config.addinivalue_line("markers", "user(role, region, distributor): pick the pool user for user_page")
+    config.addinivalue_line("markers", "deadline(seconds): time budget for all page-object waits in the test")
+
+# ------------------- #
+# Preflight health check
+# ------------------- #
+def pytest_sessionstart(session):
+    """Abort the whole run early if the UI or API host is down or too slow."""
+    config = session.config
+    if (config.getoption("--skip-preflight") or config.getoption("--collect-only")
+            or os.getenv("PREFLIGHT", "1") == "0" or os.getenv("PYTEST_XDIST_WORKER")):
+        return
+
+    login_config = ConfigService.get("login_config")
+    if not login_config["login"]["url"]:
+        logging.warning("BASE_URL is not set; skipping preflight")
+        return
+
+    report = PreflightCheck(
+        ui_url=login_config["login"]["url"],
+        api_base_url=login_config["api"]["base_url"],
+        timeout=float(os.getenv("PREFLIGHT_TIMEOUT", "5"))
+    ).run()
+
+    run_metadata.record("environment", {
+        "app_version": report["app_version"],
+        "preflight_latency_ms": {probe["name"]: probe["latency_ms"] for probe in report["probes"]}
+    })
+
+    if not report["healthy"]:
+        run_metadata.dump()
+        pytest.exit(PreflightCheck.diagnose(report), returncode=3)
 
 # ------------------- #
 # Session-level fixtures
 # ------------------- #
 @pytest.fixture(scope="session")
-def login_config(request):
-    """Build login config from environment variables and return it."""
-    config = {
-        "login": {
-            "url": os.getenv("BASE_URL"),
-            "email": os.getenv("EMAIL"),
-            "password": os.getenv("PASSWORD")
-        },
-        "api": {
-            "base_url": os.getenv("API_BASE_URL", os.getenv("BASE_URL")),
-            "timeout": int(os.getenv("API_TIMEOUT", "30000"))
-        }
-    }
+def login_config():
+    """Login and API settings: data/login_config.json overlaid with BASE_URL, EMAIL, PASSWORD, API_*."""
+    return ConfigService.get("login_config")
 
-    # Optional: Write to login_config.json for other tools or debugging
-    config_path = 'data/login_config.json'
-    os.makedirs(os.path.dirname(config_path), exist_ok=True)
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=4)
-
-    # Finalizer to reset login_config.json after all tests
-    def reset_config():
-        empty_config = {
-            "login": {"url": "", "email": "", "password": ""},
-            "api": {"base_url": "", "timeout": 30000}
-        }
-        with open(config_path, 'w') as f:
-            json.dump(empty_config, f, indent=4)
+@pytest.fixture(scope="session")
+def launch_profile(pytestconfig):
+    """Browser launch profile selected for this session."""
+    profile = get_launch_profile(pytestconfig.getoption("--launch-profile"))
+    run_metadata.record("browser", {"profile": profile["name"]})
+    return profile
 
-    request.addfinalizer(reset_config)
-    return config
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args, pytestconfig, launch_profile):
+    """
+    Launch every browser, pytest-playwright's `browser` included, from the selected profile.
+    An explicit --headed always wins; otherwise the profile only decides headless mode when it was
+    chosen with --launch-profile, LAUNCH_PROFILE or CI, and pytest-playwright's own value is kept.
+    """
+    profile_chosen = pytestconfig.getoption("--launch-profile") or os.getenv("LAUNCH_PROFILE") or os.getenv("CI")
+    if pytestconfig.getoption("--headed"):
+        headless = False
+    elif profile_chosen:
+        headless = launch_profile["headless"]
+    else:
+        headless = browser_type_launch_args.get("headless", launch_profile["headless"])
+    return {
+        **browser_type_launch_args,
+        "headless": headless,
+        "args": [*browser_type_launch_args.get("args", []), *launch_profile["args"]],
+        "slow_mo": launch_profile["slow_mo"],
+    }
 
 @pytest.fixture(scope="session")
-def browser_context_args(browser_context_args):
+def browser_context_args(browser_context_args, launch_profile):
     """Add custom browser context arguments."""
     return {
         **browser_context_args,
-        "viewport": {"width": 1280, "height": 720},
+        "viewport": launch_profile["viewport"],
+        "device_scale_factor": launch_profile["device_scale_factor"],
         "ignore_https_errors": True,
     }
 
@@ -99,51 +153,224 @@ def browser_context_args(browser_context_args):
 # UI Testing Fixtures
 # ------------------- #
 @pytest.fixture(scope="session")
-def session_browser(playwright):
-    """Create a session-scoped browser."""
-    browser = playwright.chromium.launch(headless=False)
+def session_browser(playwright, launch_profile, browser_type_launch_args):
+    """Create a session-scoped browser from the selected launch profile and time its startup."""
+    start_time = time.perf_counter()
+    browser = playwright.chromium.launch(**browser_type_launch_args)
+    launch_ms = round((time.perf_counter() - start_time) * 1000, 1)
+    run_metadata.record("browser", {"launch_ms": launch_ms, "version": browser.version})
+    logging.info(f"Browser launched with profile '{launch_profile['name']}' in {launch_ms} ms")
     yield browser
     browser.close()
 
 @pytest.fixture(scope="session")
-def session_context(session_browser, browser_context_args):
-    """Create a session-scoped browser context."""
-    context = session_browser.new_context(**browser_context_args)
+def session_cache(login_config):
+    """Storage-state cache shared by every session and worker logging in as the same user."""
+    return SessionCache(key=f'{login_config["login"]["url"]}|{login_config["login"]["email"]}')
+
+def login_with_ui(page, credentials):
+    """Drive the UI login flow on `page` and return the URL it landed on."""
+    login_page = LoginPage(page)
+    page.goto(credentials["url"], timeout=60000, wait_until="domcontentloaded")
+    login_page.wait_for_state()
+
+    result = login_page.login(
+        email=credentials["email"],
+        password=credentials["password"]
+    )
+    run_metadata.record("login", {credentials["email"]: result["timings"]})
+
+    login_page.wait_for_state()
+    return page.url
+
+def ensure_storage_state(browser, context_args, credentials, cache):
+    """
+    Return a path to a fresh storage state for `credentials`, logging in only when needed.
+    The lock makes sure only one process logs in; the others wait and reuse its result.
+    Returns None when the cache is disabled (AUTH_STATE_TTL=0); callers then log in themselves.
+    """
+    if not cache.enabled:
+        return None
+
+    with cache.lock:
+        if cache.is_fresh():
+            logging.info(f"Reusing cached storage state: {cache.state_path}")
+            return cache.state_path
+
+        context = browser.new_context(**context_args)
+        try:
+            page = context.new_page()
+            landing_url = login_with_ui(page, credentials)
+            if LoginPage(page).is_logged_in():
+                cache.save(context, landing_url=landing_url)
+            else:
+                logging.warning(f"UI login for {credentials['email']} did not reach the dashboard; storage state not cached")
+        finally:
+            context.close()
+
+    return cache.state_path if os.path.exists(cache.state_path) else None
+
+def ensure_logged_in(page, context, credentials, cache):
+    """
+    Probe the cached session on `page` and log in through the UI only when the server rejects it.
+    A state saved by another worker while this one waited for the lock is reused instead of logging in again.
+    Returns True once `page` is logged in.
+    """
+    login_page = LoginPage(page)
+    if not cache.enabled:
+        login_with_ui(page, credentials)
+        return login_page.is_logged_in()
+
+    probed_at = time.time()
+    landing_url = cache.load_meta().get("landing_url")
+    if landing_url:
+        page.goto(landing_url, timeout=60000, wait_until="domcontentloaded")
+        if login_page.is_logged_in():
+            logging.info(f"Cached session for {credentials['email']} is valid; skipping UI login")
+            return True
+        logging.info(f"Cached session for {credentials['email']} rejected by the server; logging in again")
+
+    with cache.lock:
+        meta = cache.load_meta()
+        if cache.is_fresh() and meta.get("saved_at", 0) > probed_at:
+            with open(cache.state_path, 'r') as f:
+                cookies = json.load(f).get("cookies", [])
+            context.clear_cookies()
+            context.add_cookies(cookies)
+            page.goto(meta.get("landing_url") or credentials["url"], timeout=60000, wait_until="domcontentloaded")
+            if login_page.is_logged_in():
+                logging.info(f"Reusing the session another worker just saved for {credentials['email']}")
+                return True
+
+        cache.invalidate()
+        landing_url = login_with_ui(page, credentials)
+        if login_page.is_logged_in():
+            cache.save(context, landing_url=landing_url)
+            return True
+    return False
+
+@pytest.fixture(scope="session")
+def auth_storage_state(session_browser, browser_context_args, login_config, session_cache):
+    """Path to a reusable storage state for the configured user."""
+    return ensure_storage_state(session_browser, browser_context_args, login_config["login"], session_cache)
+
+@pytest.fixture(scope="session")
+def session_context(session_browser, browser_context_args, auth_storage_state):
+    """Create a session-scoped browser context, pre-loaded with the cached login when available."""
+    start_time = time.perf_counter()
+    context = session_browser.new_context(**browser_context_args, storage_state=auth_storage_state)
+    context.new_page()
+    run_metadata.record("browser", {"first_context_ms": round((time.perf_counter() - start_time) * 1000, 1)})
     yield context
     context.close()
 
 @pytest.fixture(scope="session")
 def session_page(session_context):
-    """Create a session-scoped page."""
-    page = session_context.new_page()
+    """Return the session-scoped page opened with the context."""
+    page = session_context.pages[0]
     yield page
     page.close()
 
 @pytest.fixture(scope="session")
-def authenticated_page(session_page, login_config):
+def authenticated_page(session_page, session_context, login_config, session_cache):
     """
-    Session-scoped fixture that logs in once and returns the authenticated page.
+    Session-scoped fixture that returns an authenticated page.
+    A cached storage state is probed first; the UI login only runs when the probe fails.
     This page can be used for both UI tests and to extract cookies/tokens for API tests.
     """
     page = session_page
-    login_page = LoginPage(page)
-    
-    # Navigate to login page
-    page.goto(login_config["login"]["url"], timeout=60000, wait_until="domcontentloaded")
-    page.wait_for_load_state("networkidle")
-    
-    # Log in
-    login_page.login(
-        email=login_config["login"]["email"],
-        password=login_config["login"]["password"]
-    )
-    
-    # Wait for login to complete
-    page.wait_for_load_state("networkidle")
-    
+    ensure_logged_in(page, session_context, login_config["login"], session_cache)
+
     # Return the authenticated page
     yield page
 
+@pytest.fixture(scope="session")
+def context_pool(request, session_browser, browser_context_args, auth_storage_state, session_cache):
+    """
+    Session-scoped pool of pre-authenticated contexts.
+    Sized with CONTEXT_POOL_SIZE (pre-warmed) and CONTEXT_POOL_MAX (grown on demand).
+    Without a cached storage state (AUTH_STATE_TTL=0, or the cached login failed) the pool is
+    seeded in memory from the logged-in `authenticated_page`; the session fails if that is not logged in.
+    """
+    storage_state = auth_storage_state
+    neutral_url = session_cache.load_meta().get("landing_url")
+    if storage_state is None:
+        page = request.getfixturevalue("authenticated_page")
+        if not LoginPage(page).is_logged_in():
+            pytest.fail("Context pool needs a logged-in session, but the login did not succeed")
+        storage_state = page.context.storage_state()
+        neutral_url = neutral_url or page.url
+
+    size = int(os.getenv("CONTEXT_POOL_SIZE", "2"))
+    pool = BrowserContextPool(
+        session_browser,
+        browser_context_args,
+        storage_state=storage_state,
+        size=size,
+        max_size=int(os.getenv("CONTEXT_POOL_MAX", str(size))),
+        neutral_url=neutral_url
+    )
+    yield pool
+    logging.info(f"Context pool stats: {json.dumps(pool.stats())}")
+    run_metadata.record("context_pool", pool.stats())
+    pool.close()
+
+@pytest.fixture
+def pooled_page(context_pool):
+    """Lease an isolated, already-authenticated page from the pool for a single test."""
+    with context_pool.lease() as context:
+        yield context.pages[0]
+
+# ------------------- #
+# Multi-user Fixtures
+# ------------------- #
+@pytest.fixture(scope="session")
+def credential_pool():
+    """Load the pool of test users (TEST_USERS / data/test_users.json)."""
+    return CredentialPool.load()
+
+@pytest.fixture(scope="session")
+def user_contexts(session_browser, browser_context_args):
+    """Per-worker cache of one authenticated context per user, keyed by email."""
+    contexts = {}
+    yield contexts
+    for context in contexts.values():
+        context.close()
+
+@pytest.fixture
+def pool_user(request, credential_pool):
+    """
+    User picked from the credential pool for this test and worker.
+    Narrow the choice with @pytest.mark.user(role=..., region=..., distributor=...).
+    """
+    marker = request.node.get_closest_marker("user")
+    tags = marker.kwargs if marker else {}
+    return credential_pool.select(worker_id=os.getenv("PYTEST_XDIST_WORKER"), **tags)
+
+@pytest.fixture
+def user_page(pool_user, user_contexts, session_browser, browser_context_args, login_config):
+    """
+    Authenticated page for `pool_user`, backed by that user's own cached session.
+    The session is probed when the user's context is created; an expired one is replaced by a UI login.
+    """
+    email = pool_user["email"]
+    if email not in user_contexts:
+        credentials = {
+            "url": pool_user.get("url") or login_config["login"]["url"],
+            "email": email,
+            "password": pool_user["password"]
+        }
+        cache = SessionCache(key=f'{credentials["url"]}|{email}')
+        storage_state = ensure_storage_state(session_browser, browser_context_args, credentials, cache)
+        context = session_browser.new_context(**browser_context_args, storage_state=storage_state)
+        page = context.new_page()
+        if not ensure_logged_in(page, context, credentials, cache):
+            context.close()
+            pytest.fail(f"Could not log in as pool user {email}")
+        user_contexts[email] = context
+
+    return user_contexts[email].pages[0]
+
 # ------------------- #
 # API Testing Fixtures
 # ------------------- #
@@ -161,13 +388,45 @@ def api_request_context(playwright, login_config):
     request_context.dispose()
 
 @pytest.fixture(scope="session")
-def authenticated_api_context(playwright, authenticated_page, login_config):
-    """
-    Create an authenticated API request context using cookies from the authenticated page.
-    This allows API tests to use the same session as UI tests.
-    """
+def auth_session_manager(playwright, login_config):
+    """Session-scoped token lifecycle manager shared by every API fixture in this worker."""
+    base_url = login_config["api"]["base_url"]
+    login_context = playwright.request.new_context(
+        base_url=base_url,
+        extra_http_headers={
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+    )
+    manager = AuthSessionManager(
+        AuthAPIClient(login_context, base_url),
+        email=login_config["login"]["email"],
+        password=login_config["login"]["password"]
+    )
+    yield manager
+    logging.info(f"Auth session stats: {json.dumps(manager.stats())}")
+    run_metadata.record("auth_session", manager.stats())
+    login_context.dispose()
+
+def create_api_context_from_session(playwright, session, login_config):
+    """Return a request context carrying an API login session, no browser needed."""
+    extra_headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json"
+    }
+    if session["token"]:
+        extra_headers["Authorization"] = f"Bearer {session['token']}"
+
+    return playwright.request.new_context(
+        base_url=login_config["api"]["base_url"],
+        extra_http_headers=extra_headers,
+        storage_state={"cookies": session["cookies"], "origins": []}
+    )
+
+def create_api_context_from_page(playwright, page, login_config):
+    """Build a request context from the cookies of an authenticated browser page."""
     # Get cookies from the authenticated page
-    cookies = authenticated_page.context.cookies()
+    cookies = page.context.cookies()
     
     # Prepare extra headers with cookies
     extra_headers = {
@@ -181,13 +440,48 @@ def authenticated_api_context(playwright, authenticated_page, login_config):
         extra_headers["Cookie"] = cookie_string
     
     # Create API request context with cookies in headers
-    request_context = playwright.request.new_context(
+    return playwright.request.new_context(
         base_url=login_config["api"]["base_url"],
         extra_http_headers=extra_headers
     )
-    
-    yield request_context
-    request_context.dispose()
+
+@pytest.fixture(scope="session")
+def api_session_state():
+    """Holds the current authenticated request context and the session it was built from."""
+    state = {"context": None, "session": None}
+    yield state
+    if state["context"] is not None:
+        state["context"].dispose()
+
+@pytest.fixture
+def authenticated_api_context(request, playwright, login_config, api_session_state):
+    """
+    Return the authenticated API request context.
+    By default the session comes from an API login, so API-only runs never launch a browser;
+    the context is rebuilt whenever the session manager hands out a refreshed session.
+    Set API_AUTH_MODE=ui (or let the API login fail) to reuse the cookies of `authenticated_page`.
+    """
+    if api_session_state["context"] is not None and api_session_state["session"] is None:
+        return api_session_state["context"]
+
+    if os.getenv("API_AUTH_MODE", "api").lower() != "ui":
+        try:
+            session = request.getfixturevalue("auth_session_manager").get_session()
+            if session is not api_session_state["session"]:
+                if api_session_state["context"] is not None:
+                    api_session_state["context"].dispose()
+                api_session_state["context"] = create_api_context_from_session(playwright, session, login_config)
+                api_session_state["session"] = session
+            return api_session_state["context"]
+        except Exception as e:
+            logging.warning(f"API login failed, falling back to UI session cookies: {str(e)}")
+
+    authenticated_page = request.getfixturevalue("authenticated_page")
+    if api_session_state["context"] is not None:
+        api_session_state["context"].dispose()
+    api_session_state["context"] = create_api_context_from_page(playwright, authenticated_page, login_config)
+    api_session_state["session"] = None
+    return api_session_state["context"]
 
 @pytest.fixture
 def api_client(authenticated_api_context):
@@ -200,12 +494,12 @@ def api_client(authenticated_api_context):
 @pytest.fixture(scope="session")
 def api_endpoints():
     """Load API endpoints configuration."""
-    return load_json_config('data/api_endpoints.json')
+    return ConfigService.get("api_endpoints")
 
 @pytest.fixture(scope="session")
 def api_test_data():
     """Load API test data."""
-    return load_json_config('data/api_test_data.json')
+    return ConfigService.get("api_test_data")
 
 # ------------------- #
 # Integration Testing Fixtures
@@ -218,13 +512,82 @@ def ui_and_api_clients(authenticated_page, authenticated_api_context):
         "api": authenticated_api_context
     }
 
+def fetch_app_version(api_request_context, login_config):
+    """Application version reported by the version endpoint right now, or None if it cannot be read."""
+    try:
+        return AuthAPIClient(api_request_context, login_config["api"]["base_url"]).get_app_version()
+    except Exception as e:
+        logging.warning(f"Could not determine app version: {str(e)}")
+        return None
+
+@pytest.fixture(scope="session")
+def app_version(api_request_context, login_config):
+    """Application version, from the preflight check or the version endpoint."""
+    version = run_metadata.data.get("environment", {}).get("app_version")
+    if not version:
+        version = fetch_app_version(api_request_context, login_config) or "unknown"
+        run_metadata.record("environment", {"app_version": version})
+    return version
+
+@pytest.fixture(scope="session")
+def graph_snapshots(app_version):
+    """Graph data snapshots per filter state, shared by every test in the session."""
+    return GraphSnapshotCache(app_version)
+
+@pytest.fixture(scope="session")
+def route_cache(app_version):
+    """Deep-link routes per (report, view), persisted per app version. ROUTE_CACHE=0 disables it."""
+    if os.getenv("ROUTE_CACHE", "1") == "0":
+        yield None
+        return
+    cache = RouteCache(app_version)
+    yield cache
+    run_metadata.record("route_cache", cache.stats())
+
+@pytest.fixture(scope="session")
+def prefetch_pages(pytestconfig):
+    """
+    Background tabs each download tab may hold for its next view, or 0 (off) unless enabled with
+    --prefetch-views or PREFETCH_VIEWS=1. PREFETCH_MAX_PAGES sets the number (default 1).
+    """
+    if not (pytestconfig.getoption("--prefetch-views") or os.getenv("PREFETCH_VIEWS", "0") == "1"):
+        return 0
+    return int(os.getenv("PREFETCH_MAX_PAGES", "1"))
+
+@pytest.fixture(scope="session")
+def reports_navigation_config():
+    """Report navigation/download entries from data/reports_navigation.json."""
+    return ConfigService.get("reports_navigation")
+
+@pytest.fixture(scope="session")
+def validator_config():
+    """Report validator settings from data/validator_config.json (empty if absent)."""
+    return ConfigService.get("validator_config")
+
 # ------------------- #
 # Existing Filter Data Function
 # ------------------- #
 def get_filters_data():
     """Load filter configurations for parameterized tests."""
-    data = load_json_config('data/pipeline_filters.json')
-    return data.get('filters', [])
+    return list(ConfigService.get("pipeline_filters")["filters"])
+
+def get_filter_params():
+    """
+    Filter cases as pytest params, ordered so consecutive cases change as few dropdowns as possible.
+    When the preflight found the app version and a filter catalog for it is cached,
+    cases naming options that no longer exist are skipped at collection.
+    """
+    catalog = FilterCatalog.load(run_metadata.data.get("environment", {}).get("app_version"))
+    planner = FilterPlanner()
+    cases = get_filters_data()
+    ordered = planner.order(cases)
+    run_metadata.record("filter_plan", {"file_order": planner.summary(cases), "planned_order": planner.summary(ordered)})
+
+    params = []
+    for case in ordered:
+        reason = catalog.validate(case) if catalog else None
+        params.append(pytest.param(case, marks=pytest.mark.skip(reason=reason)) if reason else case)
+    return params
 
 # ------------------- #
 # Cleanup and Setup Hooks
@@ -242,16 +605,48 @@ def setup_and_cleanup():
     # Cleanup (if needed)
     pass
 
+@pytest.fixture(autouse=True)
+def test_deadline(request):
+    """
+    Per-test budget drawn down by every BasePage wait.
+    Set with @pytest.mark.deadline(seconds), --test-deadline or TEST_DEADLINE; no budget if unset.
+    """
+    marker = request.node.get_closest_marker("deadline")
+    seconds = (marker.args[0] if marker and marker.args
+               else request.config.getoption("--test-deadline") or os.getenv("TEST_DEADLINE"))
+    if not seconds:
+        yield None
+        return
+
+    deadline = start_deadline(int(float(seconds) * 1000), name=request.node.nodeid)
+    request.node.deadline = deadline
+    yield deadline
+    clear_deadline()
+
+@pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Generate detailed test reports with screenshots for failures."""
+    """Generate detailed test reports with screenshots and deadline usage for failures."""
+    outcome = yield
+    report = outcome.get_result()
+
     if call.when == "call" and call.excinfo is not None:
+        deadline = getattr(item, "deadline", None)
+        if deadline is not None:
+            report.sections.append(("deadline", deadline.summary()))
+
         # Test failed, take screenshot if it's a UI test
         if hasattr(item, "funcargs"):
-            if "page" in item.funcargs or "authenticated_page" in item.funcargs:
+            if any(name in item.funcargs for name in ("page", "authenticated_page", "pooled_page", "user_page")):
                 try:
-                    page = item.funcargs.get("page") or item.funcargs.get("authenticated_page")
+                    page = (item.funcargs.get("page") or item.funcargs.get("authenticated_page")
+                            or item.funcargs.get("pooled_page") or item.funcargs.get("user_page"))
                     if page:
                         screenshot_name = f"failure_{item.name}_{call.when}.png"
                         page.screenshot(path=f"screenshots/{screenshot_name}")
                 except Exception:
-                    pass  # Ignore screenshot errors
\ No newline at end of file
+                    pass  # Ignore screenshot errors
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write the run metadata collected by fixtures during the session."""
+    if len(run_metadata.data) > 1:
+        run_metadata.dump()
@@ -3,6 +3,7 @@ from typing import Dict, Any
 import base64
 from playwright.sync_api import APIResponse
 from pages.api.base_api_client import BaseAPIClient
+from common_utils.exceptions import LoginError
 
 
 class AuthAPIClient(BaseAPIClient):
@@ -25,6 +26,27 @@ class AuthAPIClient(BaseAPIClient):
         
         return response
     
+    def create_session(self, email: str, password: str) -> Dict[str, Any]:
+        """Login via API and return the cookies, token and user ID needed to reuse the session."""
+        response = self.login(email, password)
+        response_data = self.get_json_response(response)
+        if response_data.get("status") != 1:
+            raise LoginError(f"API login rejected: {response_data.get('msg')}")
+
+        try:
+            token = self.get_login_token_from_response(response)
+        except ValueError:
+            self.logger.info("No token in login response; session relies on cookies only")
+            token = None
+
+        user_data = response_data.get("data") or {}
+        return {
+            "token": token,
+            "refresh_token": response_data.get("refresh_token") or user_data.get("refresh_token"),
+            "user_id": user_data.get("id"),
+            "cookies": self.request_context.storage_state()["cookies"],
+        }
+
     def get_user_details(self,user_id:str) -> APIResponse:
         """Get user details using user ID in payload."""
         payload = {
@@ -53,6 +75,12 @@ class AuthAPIClient(BaseAPIClient):
         "msg": "Data Fetched Successfully"
     })
 
+        return response
+
+    def get_app_version(self) -> str:
+        """Return the application version string reported by the API."""
+        response = self.get_latest_version()
+        return str(response.json()["data"][0]["version"])
 
     
     def logout(self) -> APIResponse:
@@ -100,10 +128,15 @@ class AuthAPIClient(BaseAPIClient):
         response_data = self.get_json_response(login_response)
         
         # Adjust this based on your API response structure
+        user_data = response_data.get("data") if isinstance(response_data.get("data"), dict) else {}
         if "token" in response_data:
             return response_data["token"]
         elif "access_token" in response_data:
             return response_data["access_token"]
+        elif "token" in user_data:
+            return user_data["token"]
+        elif "access_token" in user_data:
+            return user_data["access_token"]
         else:
             raise ValueError(f"No token found in login response: {response_data}")
     
@@ -0,0 +1,129 @@
+# pages/api/report_export_client.py
+import os
+import time
+from typing import Dict, Any, List, Optional
+from urllib.parse import urljoin
+
+import requests
+
+from pages.api.base_api_client import BaseAPIClient
+
+
+class ReportExportClient(BaseAPIClient):
+    """
+    Downloads report exports straight from the API with the cookies of an authenticated
+    request context, streaming the body to disk instead of holding the file in memory.
+    Endpoints come from the optional "export" block of a reports_navigation.json entry:
+    {"method": "POST", "endpoint": "...", "body": {...}}.
+    Pass `cookies` when the request context carries them in a Cookie header rather than its
+    storage state (the UI-cookie fallback of authenticated_api_context).
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, request_context, base_url: str, headers: Dict[str, str] = None,
+                 timeout: float = 120, chunk_size: int = CHUNK_SIZE, cookies: List[Dict[str, Any]] = None):
+        super().__init__(request_context, base_url)
+        self.headers = headers or {}
+        self.cookies = cookies
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self._http = None
+
+    def _session(self) -> requests.Session:
+        """requests session carrying the given cookies, or those of the Playwright request context."""
+        if self._http is None:
+            self._http = requests.Session()
+            self._http.headers.update(self.headers)
+            cookies = self.cookies if self.cookies is not None else self.request_context.storage_state()["cookies"]
+            for cookie in cookies:
+                self._http.cookies.set(cookie["name"], cookie["value"],
+                                       domain=cookie.get("domain", ""), path=cookie.get("path", "/"))
+        return self._http
+
+    def download(self, url: str, path: str, method: str = "GET", body: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Stream `url` into `path` chunk by chunk; returns status, size and timing."""
+        url = urljoin(self.base_url.rstrip('/') + '/', url.lstrip('/')) if "://" not in url else url
+        self._log_request(method, url, data=body)
+        start_time = time.perf_counter()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.part"
+        size = 0
+        try:
+            with self._session().request(method, url, json=body, stream=True, timeout=self.timeout) as response:
+                self.logger.info(f"Export {url} -> {response.status_code} {response.headers.get('Content-Type')}")
+                response.raise_for_status()
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        f.write(chunk)
+                        size += len(chunk)
+            os.replace(tmp_path, path)
+        except Exception:
+            # Never leave a partial file behind
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return {
+            "url": url,
+            "path": path,
+            "status": response.status_code,
+            "bytes": size,
+            "elapsed_ms": round((time.perf_counter() - start_time) * 1000, 1),
+        }
+
+    def export_report(self, entry: Dict[str, Any], target_dir: str) -> Dict[str, Any]:
+        """Export one reports_navigation.json entry; the result has an error instead of raising."""
+        result = {"name": entry["name"], "filename": entry["download"]["filename"], "path": None, "error": None}
+        export = entry.get("export")
+        if not export:
+            result["error"] = "no export endpoint configured"
+            return result
+
+        path = os.path.join(target_dir, f"{entry['download']['filename']}{export.get('extension', '.xlsx')}")
+        try:
+            result.update(self.download(export["endpoint"], path, export.get("method", "GET"), export.get("body")))
+        except Exception as e:
+            self.logger.error(f"Export of {entry['name']} failed: {str(e)}")
+            result["error"] = str(e)
+        return result
+
+    def export_reports(self, entries: List[Dict[str, Any]], target_dir: str) -> List[Dict[str, Any]]:
+        """Export every entry that has an "export" block."""
+        return [self.export_report(entry, target_dir) for entry in entries if entry.get("export")]
+
+    @staticmethod
+    def compare_workbooks(expected_path: str, actual_path: str, max_differences: int = 20) -> List[str]:
+        """Cell-by-cell comparison of two Excel files; returns the differences found (empty when equal)."""
+        from openpyxl import load_workbook
+
+        expected = actual = None
+        try:
+            # read_only workbooks keep their file open until closed
+            expected = load_workbook(expected_path, read_only=True, data_only=True)
+            actual = load_workbook(actual_path, read_only=True, data_only=True)
+            differences = []
+            if expected.sheetnames != actual.sheetnames:
+                differences.append(f"sheets differ: {expected.sheetnames} != {actual.sheetnames}")
+
+            for sheet in (name for name in expected.sheetnames if name in actual.sheetnames):
+                expected_rows = list(expected[sheet].iter_rows(values_only=True))
+                actual_rows = list(actual[sheet].iter_rows(values_only=True))
+                if len(expected_rows) != len(actual_rows):
+                    differences.append(f"{sheet}: {len(expected_rows)} rows != {len(actual_rows)} rows")
+                for row_index, (expected_row, actual_row) in enumerate(zip(expected_rows, actual_rows), start=1):
+                    if expected_row != actual_row:
+                        differences.append(f"{sheet} row {row_index}: {expected_row} != {actual_row}")
+                    if len(differences) >= max_differences:
+                        return differences
+            return differences
+        finally:
+            for workbook in (expected, actual):
+                if workbook is not None:
+                    workbook.close()
+
+    def close(self):
+        if self._http is not None:
+            self._http.close()
+            self._http = None
@@ -0,0 +1,165 @@
+# pages/api/session_manager.py
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+from typing import Dict, Any, Optional, List
+
+from pages.api.auth_api_client import AuthAPIClient
+from common_utils.file_lock import FileLock
+
+
+class AuthSessionManager:
+    """
+    Caches the API login session, refreshes it before it expires and shares it
+    across worker processes through a lock-protected JSON store.
+    """
+
+    def __init__(self, auth_client: AuthAPIClient, email: str, password: str,
+                 store_path: str = None, token_ttl: int = None, refresh_margin: int = None):
+        self.auth_client = auth_client
+        self.email = email
+        self.password = password
+        self.token_ttl = token_ttl if token_ttl is not None else int(os.getenv("AUTH_TOKEN_TTL", "3600"))
+        self.refresh_margin = (refresh_margin if refresh_margin is not None
+                               else int(os.getenv("AUTH_TOKEN_REFRESH_MARGIN", "300")))
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        if not store_path:
+            digest = hashlib.sha1(f"{auth_client.base_url}|{email}".encode("utf-8")).hexdigest()[:12]
+            store_path = os.path.join(os.getenv("AUTH_STATE_DIR", ".auth"), f"api_session_{digest}.json")
+        self.store_path = store_path
+        self.lock = FileLock(f"{store_path}.lock")
+
+        self._session: Optional[Dict[str, Any]] = None
+        self.counters = {"logins": 0, "refreshes": 0, "refresh_failures": 0, "store_hits": 0}
+        self.latencies: Dict[str, List[float]] = {"login": [], "refresh": [], "verify": []}
+
+    @staticmethod
+    def _jwt_expiry(token: Optional[str]) -> Optional[float]:
+        """Return the `exp` claim of a JWT, or None if the token is not a decodable JWT."""
+        if not token or token.count(".") != 2:
+            return None
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+        except Exception:
+            return None
+
+    def _needs_refresh(self, session: Optional[Dict[str, Any]]) -> bool:
+        """True if the session is missing or expires within the refresh margin."""
+        return not session or session["expires_at"] - time.time() <= self.refresh_margin
+
+    def _read_store(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.store_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_store(self, session: Dict[str, Any]):
+        os.makedirs(os.path.dirname(os.path.abspath(self.store_path)), exist_ok=True)
+        tmp_path = f"{self.store_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(session, f, indent=4)
+        os.replace(tmp_path, self.store_path)
+
+    def _build_session(self, token: Optional[str], refresh_token: Optional[str],
+                       user_id: Any, cookies: list) -> Dict[str, Any]:
+        issued_at = time.time()
+        return {
+            "token": token,
+            "refresh_token": refresh_token,
+            "user_id": user_id,
+            "cookies": cookies,
+            "issued_at": issued_at,
+            "expires_at": self._jwt_expiry(token) or issued_at + self.token_ttl,
+        }
+
+    def _login(self) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        session = self.auth_client.create_session(self.email, self.password)
+        self.latencies["login"].append(time.perf_counter() - start_time)
+        self.counters["logins"] += 1
+        self.logger.info(f"Logged in via API as {self.email}")
+        return self._build_session(session["token"], session.get("refresh_token"),
+                                   session["user_id"], session["cookies"])
+
+    def _refresh(self, session: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Refresh with the stored refresh token; returns None if the server refuses."""
+        start_time = time.perf_counter()
+        try:
+            response = self.auth_client.refresh_token(session["refresh_token"])
+            if response.status != 200:
+                raise ValueError(f"refresh returned status {response.status}")
+            token = self.auth_client.get_login_token_from_response(response)
+            response_data = self.auth_client.get_json_response(response)
+        except Exception as e:
+            self.counters["refresh_failures"] += 1
+            self.logger.warning(f"Token refresh failed, falling back to login: {str(e)}")
+            return None
+
+        self.latencies["refresh"].append(time.perf_counter() - start_time)
+        self.counters["refreshes"] += 1
+        refresh_token = response_data.get("refresh_token") or session["refresh_token"]
+        return self._build_session(token, refresh_token, session["user_id"],
+                                   self.auth_client.request_context.storage_state()["cookies"])
+
+    def get_session(self) -> Dict[str, Any]:
+        """Return a session that is valid for at least the refresh margin."""
+        if not self._needs_refresh(self._session):
+            return self._session
+
+        with self.lock:
+            stored = self._read_store()
+            if not self._needs_refresh(stored):
+                self.counters["store_hits"] += 1
+                self._session = stored
+                return stored
+
+            session = None
+            if stored and stored.get("refresh_token"):
+                session = self._refresh(stored)
+            if session is None:
+                session = self._login()
+
+            self._write_store(session)
+            self._session = session
+            return session
+
+    def get_token(self) -> Optional[str]:
+        """Return the current access token, refreshing it first if needed."""
+        return self.get_session()["token"]
+
+    def verify(self) -> bool:
+        """Ask the server whether the current token is still accepted."""
+        session = self.get_session()
+        if not session["token"]:
+            return True
+
+        start_time = time.perf_counter()
+        response = self.auth_client.verify_token(session["token"])
+        self.latencies["verify"].append(time.perf_counter() - start_time)
+        return response.status == 200
+
+    def invalidate(self):
+        """Drop the cached session here and in the shared store, forcing the next call to log in."""
+        with self.lock:
+            self._session = None
+            try:
+                os.remove(self.store_path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Return refresh counters and average latencies in milliseconds."""
+        return {
+            **self.counters,
+            **{
+                f"{name}_avg_ms": round(sum(samples) / len(samples) * 1000, 1) if samples else 0.0
+                for name, samples in self.latencies.items()
+            },
+        }
@@ -1,17 +1,35 @@
 import os
 from common_utils.utils import Utils
+from common_utils.deadline import budget_timeout
+from common_utils.network_tracker import NetworkTracker
 
 import logging
 import time
+import weakref
 
 
 class BasePage:
     """Base class for all page objects"""
+
+    # Open md-select menu (AngularJS Material renders it at the end of <body>)
+    ACTIVE_SELECT_MENU = "div.md-select-menu-container.md-active"
+    READ_OPTIONS_JS = """menu => Array.from(menu.querySelectorAll('md-option'),
+        option => option.innerText.replace(/\\s+/g, ' ').trim())"""
+    # true if the option count is unchanged and option `index` still reads `text`; reads only that option
+    CHECK_OPTION_JS = """(menu, [index, text, count]) => {
+        const options = menu.querySelectorAll('md-option');
+        return options.length === count
+            && options[index].innerText.replace(/\\s+/g, ' ').trim() === text;
+    }"""
+
+    # Dropdown option texts per page, keyed by (locator, route)
+    _dropdown_option_cache = weakref.WeakKeyDictionary()
     
     def __init__(self, page):
         """Initialize with Playwright page"""
         self.page = page
         self.logger = self._setup_logging()
+        self.network = NetworkTracker.for_page(page)
     
     def _setup_logging(self):
         """Set up logging for page actions"""
@@ -35,11 +53,15 @@ class BasePage:
             logger.addHandler(file_handler)
         
         return logger
+
+    def _timeout(self, timeout, label):
+        """Timeout for a wait, capped by the remaining per-test deadline budget"""
+        return budget_timeout(timeout, label)
     
     def navigate(self, url):
         """Navigate to URL"""
         self.logger.info(f"Navigating to: {url}")
-        self.page.goto(url)
+        self.page.goto(url, timeout=self._timeout(30000, f"navigate({url})"))
     
     def get_title(self):
         """Get page title"""
@@ -49,6 +71,7 @@ class BasePage:
     
     def click_element(self, locator, timeout=30000):
         """Click an element with logging and error handling"""
+        timeout = self._timeout(timeout, f"click_element({locator})")
         try:
             self.logger.info(f"Clicking element: {locator}")
             self.page.locator(locator).click(timeout=timeout)
@@ -59,6 +82,7 @@ class BasePage:
     
     def fill_field(self, locator, text, timeout=10000):
         """Fill a field with logging and error handling"""
+        timeout = self._timeout(timeout, f"fill_field({locator})")
         try:
             self.logger.info(f"Filling field {locator} with text: {text}")
             self.page.locator(locator).fill(text, timeout=timeout)
@@ -80,7 +104,12 @@ class BasePage:
         
         - If `selector` is None → wait for page load (like 'networkidle')
         - If `selector` is provided → wait for element state (like 'visible', 'attached', etc.)
+
+        'networkidle' is served by the page's NetworkTracker: it returns once the tracked
+        data requests are done instead of waiting for every beacon and long-poll.
+        Set NETWORK_QUIET=0 to fall back to Playwright's own networkidle.
         """
+        timeout = self._timeout(timeout, f"wait_for_state({selector or 'page'}, {state})")
         if selector:
             self.logger.info(f"Waiting for element '{selector}' to be in state '{state}'")
             try:
@@ -88,6 +117,14 @@ class BasePage:
             except Exception as e:
                 self.logger.error(f"Element '{selector}' not {state} in time: {str(e)}")
                 raise
+        elif state == "networkidle" and os.getenv("NETWORK_QUIET", "1") != "0":
+            self.logger.info("Waiting for tracked network requests to go quiet")
+            try:
+                waited_ms = self.network.wait_for_quiet(timeout=timeout)
+                self.logger.info(f"Network quiet after {waited_ms} ms")
+            except Exception as e:
+                self.logger.error(f"Network did not go quiet in time: {str(e)}")
+                raise
         else:
             self.logger.info(f"Waiting for page load state '{state}'")
             try:
@@ -98,6 +135,7 @@ class BasePage:
 
     def wait_for_element(self, locator, timeout=10000):
         """Wait for an element to be visible"""
+        timeout = self._timeout(timeout, f"wait_for_element({locator})")
         self.logger.info(f"Waiting for element to be visible: {locator}")
         try:
             self.page.locator(locator).wait_for(state="visible", timeout=timeout)
@@ -108,6 +146,7 @@ class BasePage:
         
     def get_text(self, locator, timeout=10000):
         """Get text content of an element"""
+        timeout = self._timeout(timeout, f"get_text({locator})")
         try:
             self.logger.info(f"Getting text from: {locator}")
             return self.page.locator(locator).text_content(timeout=timeout)
@@ -119,7 +158,7 @@ class BasePage:
 
         try:
             self.logger.info("refreshing the page")
-            self.page.reload()
+            self.page.reload(timeout=self._timeout(30000, "page_refresh reload"))
             self.logger.info(f"waiting for page state {state}")
             self.wait_for_state(state=state,timeout=timeout)
             self.logger.info("page is refeshed")
@@ -132,6 +171,7 @@ class BasePage:
 
     def is_element_present(self, locator, timeout=10000):
         """Check if element exists in the DOM"""
+        timeout = self._timeout(timeout, f"is_element_present({locator})")
         try:
             self.page.locator(locator).wait_for(timeout=timeout)
             return True
@@ -149,31 +189,84 @@ class BasePage:
             self.logger.error(f"Error scrolling to {locator}: {str(e)}")
             return False
         
+    def _open_dropdown(self, locator):
+        """Open an md-select and return the locator of its menu once its options are shown"""
+        dropdown = self.page.locator(locator)
+        dropdown.wait_for(state="visible", timeout=self._timeout(5000, f"open dropdown {locator}"))
+        dropdown.click(force=True)
+
+        menu = self.page.locator(self.ACTIVE_SELECT_MENU)
+        menu.locator("md-option").first.wait_for(
+            state="visible", timeout=self._timeout(5000, f"dropdown options {locator}")
+        )
+        return menu
+
+    def _dropdown_cache(self):
+        """Option-text cache for this page, keyed by (locator, route)"""
+        cache = BasePage._dropdown_option_cache.get(self.page)
+        if cache is None:
+            cache = BasePage._dropdown_option_cache[self.page] = {}
+        return cache
+
+    def _dropdown_key(self, locator):
+        return (locator, self.page.url.split("#", 1)[-1].split("?", 1)[0])
+
+    def _read_options(self, locator, menu):
+        """Read every option text of an open menu in one evaluate and cache it"""
+        options = menu.evaluate(self.READ_OPTIONS_JS)
+        self._dropdown_cache()[self._dropdown_key(locator)] = options
+        self.logger.info(f"Cached {len(options)} options for {locator}")
+        return options
+
+    def read_dropdown_options(self, locator):
+        """Return the option texts of an md-select (cached per locator and route)"""
+        key = self._dropdown_key(locator)
+        if key in self._dropdown_cache():
+            return list(self._dropdown_cache()[key])
+
+        menu = self._open_dropdown(locator)
+        options = self._read_options(locator, menu)
+        self.page.keyboard.press("Escape")
+        return list(options)
+
+    def invalidate_dropdown_cache(self, locator=None):
+        """Forget cached options for one locator (any route) or for every dropdown on the page"""
+        cache = self._dropdown_cache()
+        for key in [key for key in cache if locator is None or key[0] == locator]:
+            del cache[key]
+
     def select_dropdown_by_text(self, locator, option_text):
-        """Select an option from an AngularJS Material md-select dropdown"""
+        """
+        Select an option from an AngularJS Material md-select dropdown.
+        The first opening reads all option texts in one evaluate and caches their indices per
+        locator and route; later selections click the cached index directly. If the option
+        list no longer matches the cache it is re-read.
+        """
         try:
-            # Step 1: Click the select dropdown
-            dropdown = self.page.locator(locator)
-            dropdown.wait_for(state="visible", timeout=5000)
-            dropdown.click(force=True)
-            self.page.wait_for_timeout(300)
-
-            
-            # Step 2: Filter only visible 'md-option's with the exact text
-            option_xpath = f'//div[contains(@class, "md-select-menu-container")]//md-option[.//div[normalize-space(text())="{option_text}"] or normalize-space(text())="{option_text}"]'
-            option_locator = self.page.locator(option_xpath)
-            option_locator.first.wait_for(state="visible", timeout=5000)
+            # Step 1: Open the select dropdown and wait for its own menu (no fixed sleep)
+            menu = self._open_dropdown(locator)
 
-            # Optional: Log found matching options
-            count = option_locator.count()
-            self.logger.info(f"Found {count} visible options with text '{option_text}'")
+            # Step 2: Find the option index, from the cache when the menu still matches it
+            target = " ".join(option_text.split())
+            options = self._dropdown_cache().get(self._dropdown_key(locator))
+            fresh = options is None
+            if fresh:
+                options = self._read_options(locator, menu)
+            elif target in options and not menu.evaluate(
+                    self.CHECK_OPTION_JS, [options.index(target), target, len(options)]):
+                self.logger.info(f"Option list of {locator} changed; refreshing cache")
+                options, fresh = self._read_options(locator, menu), True
 
-            if count == 0:
+            if target not in options and not fresh:
+                # The cache may predate a change in the option list; re-read once before giving up
+                options = self._read_options(locator, menu)
+            if target not in options:
                 self.logger.info(f"Option '{option_text}' not found or is hidden.")
+                self.page.keyboard.press("Escape")
                 return False
 
-            # Step 4: Click the first matching visible option
-            option_locator.first.click(force=True)
+            # Step 3: Click the option at its index inside this menu only
+            menu.locator("md-option").nth(options.index(target)).click(force=True)
             return True
 
         except Exception as e:
@@ -200,7 +293,7 @@ class BasePage:
         element = self.page.locator(locator)
 
         # Wait until attached
-        element.wait_for(state="attached", timeout=5000)
+        element.wait_for(state="attached", timeout=self._timeout(5000, f"scroll_if_not_visible_then_click({locator})"))
 
         # Check if element is off-screen
         is_off_screen = element.evaluate(
@@ -216,5 +309,5 @@ class BasePage:
             self.page.wait_for_timeout(1500)  # Wait 1.5 seconds for scroll to settle
 
         # Then use your existing safe click method
-        self.click_element(self.locator)    
+        self.click_element(locator)    
 
@@ -1,14 +1,25 @@
 """
 Dashboard page object
 """
+import time
+from urllib.parse import urlsplit
+
 from pages.base_page import BasePage
+from common_utils.network_tracker import NetworkTracker
 
 class DashboardPage(BasePage):
     """Page object for dashboard page"""
 
-    def __init__(self, page):
+    def __init__(self, page, routes=None):
         """Initialize login page"""
         super().__init__(page)
+        # Optional RouteCache used to deep-link views instead of clicking through the menu
+        self.routes = routes
+        # Duration (s) of every menu click made through navigate_to_section / every route goto
+        self.click_timings = []
+        self.route_timings = []
+        # False after a deep link, when the menu may not show the current section expanded
+        self._menu_in_sync = True
 
     
     # Element locators
@@ -58,16 +69,94 @@ class DashboardPage(BasePage):
 
 
     
+    def switch_to_page(self, page):
+        """Continue on another tab that was opened on a view by URL (e.g. a prefetched one)"""
+        self.page = page
+        self.network = NetworkTracker.for_page(page)
+        self._menu_in_sync = False
+
     def navigate_to_section(self, section_name, locator):
         """Generic navigation method that takes a section name and locator"""
         self.logger.info(f"Navigating to {section_name} using locator: {locator}")
         
         try:
-            self.click_element(locator)
+            if not self.click_element(locator):
+                return False
             self.wait_for_state()
             return True
         except Exception as e:
             self.logger.error(f"Error navigating to {section_name}: {str(e)}")
             return False
-            
-    
\ No newline at end of file
+
+    def navigate_to_reports(self):
+        """Expand the Reports menu unless its sections are already showing"""
+        if self.page.locator(self.CHURN_DASHBOARD_BUTTON).is_visible():
+            self.logger.info("Reports menu already expanded")
+            return True
+        return self.navigate_to_section("Reports", self.REPORTS_BUTTON)
+
+    @staticmethod
+    def hash_path(url):
+        """Route part of a hash URL ('#/a/b?x=1' -> '/a/b'), ignoring query string and trailing slash"""
+        fragment = urlsplit(url).fragment
+        return fragment.split("?", 1)[0].rstrip("/") or "/"
+
+    def open_route(self, url):
+        """Jump straight to a hash route; False if the app no longer resolves it."""
+        start_time = time.perf_counter()
+        try:
+            self.navigate(url)
+            self.wait_for_state()
+        except Exception as e:
+            self.logger.warning(f"Route {url} failed to load: {str(e)}")
+            return False
+        finally:
+            self.route_timings.append(time.perf_counter() - start_time)
+
+        if self.hash_path(self.page.url) != self.hash_path(url):
+            self.logger.warning(f"Route {url} redirected to {self.page.url}")
+            return False
+        return True
+
+    def open_report_view(self, step):
+        """
+        Follow one NavigationPlanner step. A route cached for the (report, view) pair is opened
+        with goto; otherwise the report section and/or the view are clicked, only when the
+        plan says they are not already open, and the URL reached is recorded for next time.
+        """
+        entry = step["entry"]
+        report_name = entry["name"]
+        report, view = entry["navigation"]["report"], entry["navigation"]["view"]
+        if not (step["open_section"] or step["open_view"]):
+            self.logger.info(f"{report_name} view already open")
+            return True
+
+        if self.routes:
+            url = self.routes.get(report, view)
+            if url and self.open_route(url):
+                self._menu_in_sync = False
+                return True
+            if url:
+                self.routes.forget(report, view)
+
+        open_section, open_view = step["open_section"], step["open_view"]
+        if not self._menu_in_sync:
+            # The expanded section is unknown and view links are shared between sections
+            # (e.g. SUMMARY_LINK), so a visible view link does not prove the right section is open
+            open_section, open_view = True, view != report
+
+        for needed, label, locator_name in ((open_section, report_name, report),
+                                            (open_view, f"{report_name} View", view)):
+            if not needed:
+                self.logger.info(f"{label} already open, skipping click on {locator_name}")
+                continue
+            start_time = time.perf_counter()
+            success = self.navigate_to_section(label, getattr(self, locator_name))
+            self.click_timings.append(time.perf_counter() - start_time)
+            if not success:
+                return False
+
+        self._menu_in_sync = True
+        if self.routes:
+            self.routes.put(report, view, self.page.url)
+        return True
@@ -0,0 +1,274 @@
+"""
+Runs report downloads on several tabs of one authenticated context
+"""
+import os
+import time
+import logging
+from collections import deque
+
+from common_utils.navigation_planner import NavigationPlanner
+from common_utils.run_metadata import run_metadata
+from common_utils.view_prefetcher import ViewPrefetcher
+from pages.dashboard.dashboard_page import DashboardPage
+from pages.dashboard.report_page import ReportPage
+
+
+class DownloadOrchestrator:
+    """
+    Spreads reports_navigation.json entries over `concurrency` pages of the same context.
+    Each tab takes a whole report section at a time (see NavigationPlanner.groups), so a section
+    it has expanded is not clicked again for the next view. The sync API cannot block on several downloads at once, so each tab navigates and clicks
+    its download button, then the orchestrator moves on and collects `download` events as the
+    server finishes the exports. Each download is tagged with the job that was waiting on its tab
+    when it arrived, and a tab whose job timed out is replaced, so a late file is never saved
+    under the next report's name. A failing report only frees its tab for the next entry.
+    With `prefetch_pages`, each tab loads the cached route of its next entry in a background
+    tab while it waits for its download, and continues on that tab when it is ready.
+    """
+
+    def __init__(self, context, download_dir, concurrency=None, start_url=None, routes=None,
+                 download_timeout=120000, poll_ms=100, prefetch_pages=0):
+        self.context = context
+        self.download_dir = download_dir
+        self.concurrency = concurrency or int(os.getenv("DOWNLOAD_CONCURRENCY", "3"))
+        self.start_url = start_url
+        self.routes = routes
+        self.download_timeout = download_timeout
+        self.poll_ms = poll_ms
+        self.prefetch_pages = prefetch_pages
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.results = []
+        self._used_paths = set()
+        # Menu click durations and route jumps of tabs that have been closed
+        self._click_timings = []
+        self._route_count = 0
+        self._naive_clicks = 0
+        # Section groups not yet taken by a tab
+        self._groups = deque()
+
+    def _open_lane(self, index):
+        lane = {"index": index, "job": None, "downloads": [], "queue": deque(), "page": None,
+                "prefetcher": ViewPrefetcher(self.context, max_pages=self.prefetch_pages)
+                if self.prefetch_pages and self.routes else None}
+        self._open_page(lane)
+        return lane
+
+    def _open_page(self, lane):
+        """Give the lane a fresh tab on the Reports menu; downloads are tagged with the job waiting at arrival."""
+        page = self.context.new_page()
+        if self.start_url:
+            page.goto(self.start_url, wait_until="domcontentloaded")
+        lane.update({"page": page, "dashboard": DashboardPage(page, routes=self.routes),
+                     "report": ReportPage(page), "state": None})
+        page.on("download", lambda download: self._on_download(lane, page, download))
+        lane["dashboard"].navigate_to_reports()
+
+    def _adopt_page(self, lane, page):
+        """Continue the lane on a prefetched tab; its dashboard keeps counting clicks across tabs."""
+        old_page = lane["page"]
+        lane["dashboard"].switch_to_page(page)
+        lane.update({"page": page, "report": ReportPage(page)})
+        page.on("download", lambda download: self._on_download(lane, page, download))
+        try:
+            old_page.close()
+        except Exception:
+            pass
+
+    def _take_prefetched(self, lane, step):
+        """Prefetched tab already on the step's view, or None."""
+        if lane["prefetcher"] is None or not (step["open_section"] or step["open_view"]):
+            return None
+        navigation = step["entry"]["navigation"]
+        url = self.routes.peek(navigation["report"], navigation["view"])
+        return lane["prefetcher"].take(url) if url else None
+
+    def _prefetch_next(self, lane):
+        """Start loading the cached route of the entry this lane will most likely run next."""
+        if lane["prefetcher"] is None:
+            return
+        entry = lane["queue"][0] if lane["queue"] else (self._groups[0][0] if self._groups else None)
+        if entry is None:
+            return
+        step = NavigationPlanner.transition(lane["state"], entry)
+        if step["open_section"] or step["open_view"]:
+            lane["prefetcher"].prefetch(self.routes.peek(entry["navigation"]["report"], entry["navigation"]["view"]))
+
+    def _on_download(self, lane, page, download):
+        job = lane["job"]
+        if page is not lane["page"] or job is None or not job.get("waiting"):
+            self.logger.warning(f"[tab {lane['index']}] Ignoring download {download.suggested_filename} "
+                                f"that no waiting report started")
+            return
+        lane["downloads"].append((job, download))
+
+    def _close_page(self, lane):
+        if lane["page"] is None:
+            return
+        self._click_timings.extend(lane["dashboard"].click_timings)
+        self._route_count += len(lane["dashboard"].route_timings)
+        try:
+            lane["page"].close()
+        except Exception:
+            pass
+        lane["page"] = None
+
+    def _target_path(self, filename, suggested_filename):
+        """Expected file name with the server's extension; repeated names get a numeric suffix."""
+        extension = os.path.splitext(suggested_filename)[1] or ".xlsx"
+        path = os.path.join(self.download_dir, f"{filename}{extension}")
+        counter = 2
+        while path in self._used_paths:
+            path = os.path.join(self.download_dir, f"{filename}_{counter}{extension}")
+            counter += 1
+        self._used_paths.add(path)
+        return path
+
+    def _finish(self, lane, error=None, path=None, url=None):
+        job = lane["job"]
+        now = time.perf_counter()
+        result = {
+            "name": job["entry"]["name"],
+            "filename": job["entry"]["download"]["filename"],
+            "lane": lane["index"],
+            "path": path,
+            "url": url,
+            "error": error,
+            "navigate_ms": round(((job.get("clicked_at") or now) - job["started_at"]) * 1000, 1),
+            "wait_ms": round((now - job["clicked_at"]) * 1000, 1) if job.get("clicked_at") else 0.0,
+            "total_ms": round((now - job["started_at"]) * 1000, 1),
+        }
+        if error:
+            self.logger.error(f"[tab {lane['index']}] {result['name']} ({result['filename']}) failed: {error}")
+            # The menu state of this tab is unknown now; the next entry clicks its full route
+            lane["state"] = None
+        else:
+            self.logger.info(f"[tab {lane['index']}] {result['name']} saved to {path} in {result['total_ms']} ms")
+        self.results.append(result)
+        lane["job"] = None
+
+    def _start(self, lane, entry):
+        """Navigate the tab to the entry's view and click its download button, without waiting for the file."""
+        lane["job"] = {"entry": entry, "started_at": time.perf_counter()}
+        lane["downloads"].clear()
+        try:
+            step = {"entry": entry, **NavigationPlanner.transition(lane["state"], entry)}
+            prefetched = self._take_prefetched(lane, step)
+            if prefetched:
+                self.logger.info(f"[tab {lane['index']}] Using prefetched tab for {entry['navigation']}")
+                self._adopt_page(lane, prefetched)
+            elif not lane["dashboard"].open_report_view(step):
+                raise RuntimeError(f"could not navigate to {entry['navigation']}")
+            lane["state"] = {"section": entry["navigation"]["report"], "view": entry["navigation"]["view"]}
+
+            report_page = lane["report"]
+            lane["page"].click(getattr(report_page, entry["download"]["button"]))
+            report_page.wait_for_state()
+            # Events are dispatched during the click itself, so the job must already accept its download
+            lane["job"]["waiting"] = True
+            lane["page"].click(getattr(report_page, entry["download"]["selector"]))
+            lane["job"]["clicked_at"] = time.perf_counter()
+            # The next view loads in the background while this export is generated
+            self._prefetch_next(lane)
+        except Exception as e:
+            self._finish(lane, error=str(e))
+
+    def _check(self, lane):
+        """Save the tab's download if it has started, or fail the entry once it timed out."""
+        job = lane["job"]
+        # Only a download that arrived while this job was waiting belongs to it
+        lane["downloads"] = [(owner, download) for owner, download in lane["downloads"] if owner is job]
+        if lane["downloads"]:
+            _, download = lane["downloads"].pop(0)
+            try:
+                path = self._target_path(job["entry"]["download"]["filename"], download.suggested_filename)
+                download.save_as(path)
+                failure = download.failure()
+                self._finish(lane, error=f"download failed: {failure}" if failure else None,
+                             path=path, url=download.url)
+            except Exception as e:
+                self._finish(lane, error=str(e))
+        elif (time.perf_counter() - job["clicked_at"]) * 1000 > self.download_timeout:
+            self._finish(lane, error=f"no download within {self.download_timeout} ms")
+            # The export may still arrive later; drop this tab so it cannot reach the next job
+            self._close_page(lane)
+            try:
+                self._open_page(lane)
+            except Exception as e:
+                self.logger.error(f"[tab {lane['index']}] Could not reopen tab, handing its section back: {str(e)}")
+                self._close_page(lane)
+                if lane["queue"]:
+                    self._groups.appendleft(lane["queue"])
+                    lane["queue"] = deque()
+
+    def _fail_queued(self, error):
+        """Record every entry still queued as failed, e.g. once no tab is left to run it."""
+        for entry in (entry for group in self._groups for entry in group):
+            self.results.append({"name": entry["name"], "filename": entry["download"]["filename"], "lane": None,
+                                 "path": None, "url": None, "error": error,
+                                 "navigate_ms": 0.0, "wait_ms": 0.0, "total_ms": 0.0})
+        self._groups.clear()
+
+    def run(self, entries):
+        """Download every entry; returns one result dict per entry with timings and error (None on success)."""
+        os.makedirs(self.download_dir, exist_ok=True)
+        planner = NavigationPlanner(entries)
+        self._naive_clicks = planner.summary()["naive_clicks"]
+        self._groups = deque(deque(group) for group in planner.groups())
+        lanes = [self._open_lane(index) for index in range(min(self.concurrency, len(self._groups)))]
+        start_time = time.perf_counter()
+        try:
+            while self._groups or any(lane["job"] or lane["queue"] for lane in lanes):
+                for lane in (lane for lane in lanes if lane["page"] is not None):
+                    if lane["job"] is not None:
+                        self._check(lane)
+                        continue
+                    if not lane["queue"] and self._groups:
+                        lane["queue"] = self._groups.popleft()
+                    if lane["queue"]:
+                        self._start(lane, lane["queue"].popleft())
+
+                live = [lane for lane in lanes if lane["page"] is not None]
+                if not live:
+                    self._fail_queued("no browser tab left to download with")
+                    break
+                # Let Playwright dispatch download events for every tab
+                live[0]["page"].wait_for_timeout(self.poll_ms)
+        finally:
+            for lane in lanes:
+                self._close_page(lane)
+                if lane["prefetcher"] is not None:
+                    lane["prefetcher"].close()
+
+        if self.prefetch_pages and self.routes:
+            run_metadata.record("view_prefetch", ViewPrefetcher.combined_stats(
+                lane["prefetcher"] for lane in lanes))
+        summary = self.summary(time.perf_counter() - start_time)
+        run_metadata.record("report_downloads", summary)
+        self.logger.info(f"Report downloads: {summary}")
+        return self.results
+
+    def navigation_summary(self):
+        """Menu clicks actually made by all tabs against clicking section + view for every entry."""
+        timings = self._click_timings
+        avg_click_ms = round(sum(timings) / len(timings) * 1000, 1) if timings else 0.0
+        clicks_saved = self._naive_clicks - len(timings)
+        return {
+            "naive_clicks": self._naive_clicks,
+            "clicks_made": len(timings),
+            "clicks_saved": clicks_saved,
+            "routes_opened": self._route_count,
+            "avg_click_ms": avg_click_ms,
+            "estimated_saved_ms": round(clicks_saved * avg_click_ms, 1),
+        }
+
+    def summary(self, wall_time):
+        """Counts, wall-clock time and the sum of per-report times (what a sequential run would take)."""
+        return {
+            "reports": len(self.results),
+            "failed": sum(1 for result in self.results if result["error"]),
+            "concurrency": self.concurrency,
+            "wall_ms": round(wall_time * 1000, 1),
+            "sum_report_ms": round(sum(result["total_ms"] for result in self.results), 1),
+            "clicks_made": len(self._click_timings),
+            "routes_opened": self._route_count,
+        }
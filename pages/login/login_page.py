@@ -4,6 +4,8 @@ Login page object
 
 import time
 
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
 from pages.base_page import BasePage
 
 class LoginPage(BasePage):
@@ -15,6 +17,12 @@ class LoginPage(BasePage):
     LOGIN_BUTTON = "role=button[name='Log in']"
     CANCEL_DIALOG_BUTTON = "div[role='button'][aria-label='Cancel Dialog']"
     FEATURES_CARD='xpath=//*[@id="dialogContent_0"]//label[contains(text(), "Check Out For New Features")]'
+    APP_MENU_BUTTON = "role=button[name='Reports']"
+    ERROR_MESSAGE = "md-toast, [role='alert']"
+
+    # Login XHR issued by the form, and how often a pending login is re-checked
+    LOGIN_API_PATH = "/login"
+    LOGIN_POLL_SLICE_MS = 250
 
 
 
@@ -24,10 +32,29 @@ class LoginPage(BasePage):
         """Initialize login page"""
         super().__init__(page)
     
-    def login(self, email, password):
-        """Perform login with provided credentials"""
+    def login(self, email, password, timeout=30000, screenshot=False):
+        """
+        Perform login with provided credentials and wait for real completion signals:
+        the login XHR response, the dashboard route or an error message on the page.
+        Returns a dict with success, url, error, dialog_dismissed and per-phase timings (ms).
+        """
         self.logger.info(f"Logging in with email: {email}")
-        
+        timings = {}
+        result = {"success": False, "url": None, "error": None, "dialog_dismissed": False, "timings": timings}
+        login_responses = []
+        dialog_button = self.page.locator(self.CANCEL_DIALOG_BUTTON)
+        handler_added = False
+        start_time = time.perf_counter()
+
+        def on_response(response):
+            if response.request.method == "POST" and response.url.split("?")[0].endswith(self.LOGIN_API_PATH):
+                login_responses.append((time.perf_counter(), response))
+
+        def dismiss_dialog():
+            self.logger.info("Release notes dialog appeared. Dismissing it.")
+            self.page.locator(self.CANCEL_DIALOG_BUTTON).click()
+            result["dialog_dismissed"] = True
+
         try:
             # Enter email
             self.click_element(self.EMAIL_INPUT)
@@ -39,30 +66,109 @@ class LoginPage(BasePage):
             
             # Click inputs container (as in original script)
             self.page.locator("#inputs").click()
-            
-            # Click login button
-            self.click_element(self.LOGIN_BUTTON)
+            timings["fill_ms"] = self._elapsed_ms(start_time)
 
-            # Take a screenshot to see the state after login
-            time.sleep(10)
-            self.logger.info("Taking screenshot after login")
-            self.take_screenshot(name="post_login.png")
-            
+            # Dismiss the release notes dialog as soon as it gets in the way of an action
+            self.page.add_locator_handler(dialog_button, dismiss_dialog, times=1)
+            handler_added = True
 
+            # Click login button and wait for the dashboard route or an error message
+            self.page.on("response", on_response)
+            submit_time = time.perf_counter()
+            self.click_element(self.LOGIN_BUTTON)
+            result["error"] = self._wait_for_login_outcome(login_responses, timeout)
+
+            if login_responses:
+                timings["login_response_ms"] = round((login_responses[0][0] - submit_time) * 1000, 1)
+            timings["navigation_ms"] = self._elapsed_ms(submit_time)
 
-            # Check for and dismiss the dialog
             current_url = self.page.url
             self.logger.info(f"current url:{current_url}")
-            if "dashboard" in current_url:
-                if self.is_element_visible(self.CANCEL_DIALOG_BUTTON):
-                    self.logger.info("Release notes dialog found. Attempting to dismiss.")
-                    self.click_element(self.CANCEL_DIALOG_BUTTON)
-                else:
-                    self.logger.info("Release notes dialog not present.")
-            
-        
+            result["url"] = current_url
+            result["success"] = result["error"] is None and "dashboard" in current_url
+
+            # The dialog may already be open; dismiss it without waiting for the next action
+            if result["success"] and not result["dialog_dismissed"]:
+                dialog_time = time.perf_counter()
+                if self.page.locator(self.CANCEL_DIALOG_BUTTON).is_visible():
+                    dismiss_dialog()
+                timings["dialog_ms"] = self._elapsed_ms(dialog_time)
+
+            if screenshot:
+                self.logger.info("Taking screenshot after login")
+                self.take_screenshot(name="post_login")
+
         except Exception as e:
             self.logger.error(f"Login failed: {str(e)}")
+            result["error"] = str(e)
             # Take screenshot on failure
             self.page.screenshot(path="screenshots/login_failure.png")
-            return False    
+        finally:
+            self.page.remove_listener("response", on_response)
+            # Do not leave a handler behind on a page that may log in again later
+            if handler_added:
+                self.page.remove_locator_handler(dialog_button)
+
+        timings["total_ms"] = self._elapsed_ms(start_time)
+        if result["success"]:
+            self.logger.info(f"Login completed: {timings}")
+        else:
+            self.logger.error(f"Login did not complete: {result['error']} ({timings})")
+        return result
+
+    def _wait_for_login_outcome(self, login_responses, timeout):
+        """
+        Wait until the dashboard route or an error message shows up, returning the error text (or None).
+        A rejected login XHR ends the wait early instead of running into the timeout.
+        """
+        deadline = time.perf_counter() + timeout / 1000
+        while True:
+            try:
+                # Only a rendered message with text counts; empty or hidden alert regions are ignored
+                handle = self.page.wait_for_function(
+                    """([errorSelector]) => {
+                        if (location.href.includes('dashboard')) return {error: null};
+                        const shown = Array.from(document.querySelectorAll(errorSelector)).find(el =>
+                            el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden'
+                            && el.innerText.trim() !== '');
+                        return shown ? {error: shown.innerText.trim()} : false;
+                    }""",
+                    arg=[self.ERROR_MESSAGE],
+                    timeout=self.LOGIN_POLL_SLICE_MS
+                )
+                return handle.json_value()["error"]
+            except PlaywrightTimeoutError:
+                rejection = self._login_rejection(login_responses)
+                if rejection:
+                    return rejection
+                if time.perf_counter() > deadline:
+                    return f"Login did not reach the dashboard within {timeout} ms"
+
+    def _login_rejection(self, login_responses):
+        """Return an error message if the login XHR came back as a failure."""
+        if not login_responses:
+            return None
+        response = login_responses[0][1]
+        if response.status >= 400:
+            return f"Login request failed with status {response.status}"
+        try:
+            body = response.json()
+        except Exception:
+            return None
+        if isinstance(body, dict) and body.get("status") not in (None, 1):
+            return body.get("msg") or "Login rejected by server"
+        return None
+
+    @staticmethod
+    def _elapsed_ms(start_time):
+        return round((time.perf_counter() - start_time) * 1000, 1)
+
+    def is_logged_in(self, timeout=5000):
+        """Cheap session probe: True if the app menu renders, False if the login form is shown"""
+        menu = self.page.locator(self.APP_MENU_BUTTON)
+        try:
+            menu.or_(self.page.locator(self.EMAIL_INPUT)).first.wait_for(state="visible", timeout=timeout)
+            return menu.is_visible()
+        except Exception as e:
+            self.logger.info(f"Session probe inconclusive: {str(e)}")
+            return False
@@ -0,0 +1,87 @@
+"""
+Keeps the Pipeline Sufficiency dashboard open across filter cases
+"""
+import logging
+
+from common_utils.filter_planner import FilterPlanner
+from common_utils.graph_snapshot_cache import GraphSnapshotCache
+from common_utils.run_metadata import run_metadata
+from pages.pipeline.pipeline_suffciency_page import GraphPage
+
+
+class FilterSession:
+    """
+    Applies filter cases one after another on a single open dashboard, changing only the
+    dropdowns that differ from the current state. Reloads only when a field has to be cleared
+    or the page was navigated away from by another test.
+    """
+
+    def __init__(self, graph_page: GraphPage, planner: FilterPlanner = None,
+                 snapshots: GraphSnapshotCache = None):
+        self.graph_page = graph_page
+        self.planner = planner or FilterPlanner()
+        self.snapshots = snapshots or GraphSnapshotCache()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.state = {}
+        self.dashboard_url = None
+        self.baseline = None
+        self.needs_reload = False
+        self.counters = {"cases": 0, "navigations": 0, "dropdown_changes": 0,
+                         "naive_navigations": 0, "naive_dropdown_changes": 0}
+
+    def _open(self, reload=False):
+        """Bring up the unfiltered dashboard; its graph data is scraped only if not cached or reloaded."""
+        if reload:
+            self.graph_page.page_refresh(state="domcontentloaded")
+            # Let the graph requests of the reload finish before the baseline is scraped
+            self.graph_page.wait_for_state()
+            # A reset reload fetches fresh data; the cached baseline may predate it
+            self.snapshots.invalidate({})
+        else:
+            self.graph_page.navigate_to_pipeline_sufficiency()
+        self.graph_page.wait_for_graphs_to_load()
+        self.counters["navigations"] += 1
+        self.dashboard_url = self.graph_page.page.url
+        self.state = {}
+        self.needs_reload = False
+        self.baseline = self.snapshots.get_or_capture({}, self.graph_page.get_all_graph_data)
+
+    def apply(self, case):
+        """
+        Move the dashboard to filter state `case`. Returns True if every dropdown was set.
+        `self.baseline` holds the unfiltered graph data to compare against.
+        """
+        case = self.planner.normalize(case)
+        self.counters["cases"] += 1
+        self.counters["naive_navigations"] += 1
+        self.counters["naive_dropdown_changes"] += len(case)
+
+        if self.dashboard_url is None or self.graph_page.page.url != self.dashboard_url:
+            self._open()
+
+        needs_reset, changes = self.planner.transition(self.state, case)
+        if needs_reset or self.needs_reload:
+            self.logger.info(f"Reloading dashboard to clear filters {sorted(set(self.state) - set(case))}")
+            self._open(reload=True)
+            changes = case
+
+        self.logger.info(f"Applying filter changes {changes} (from {self.state})")
+        success = self.graph_page.change_filter(**changes) if changes else True
+        self.counters["dropdown_changes"] += len(changes)
+        # A failed change leaves the dropdowns in an unknown state; start clean next time
+        self.state = case
+        self.needs_reload = not success
+        return success
+
+    def stats(self):
+        """Navigation and dropdown counters, with the savings against re-navigating per case."""
+        return {
+            **self.counters,
+            "navigations_saved": self.counters["naive_navigations"] - self.counters["navigations"],
+            "dropdown_changes_saved": self.counters["naive_dropdown_changes"] - self.counters["dropdown_changes"],
+        }
+
+    def record(self):
+        run_metadata.record("filter_session", self.stats())
+        run_metadata.record("graph_snapshots", self.snapshots.stats())
+        self.logger.info(f"Filter session stats: {self.stats()}")
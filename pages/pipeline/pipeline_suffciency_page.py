@@ -3,11 +3,102 @@ Pipeline sufficiency page object
 """
 from pages.base_page import BasePage
 from playwright.sync_api import Page, expect
+from common_utils.run_metadata import run_metadata
+from common_utils.config import ConfigService
+from common_utils.response_capture import ResponseCapture
+import io
+import os
 import time
+import uuid
+
+# Resolves once every graph container holds non-empty .data-value nodes, or shows an explicit
+# no-data marker, and none of the containers has changed for `settleMs`; returns browser-side
+# timestamps and the names of the empty graphs for reporting. A container without values and
+# without the marker is still waiting for its data.
+GRAPHS_READY_JS = """({token, xpaths, settleMs, noDataSelector}) => {
+    let state = window.__graphsReady;
+    if (!state || state.token !== token) {
+        if (state && state.observer) state.observer.disconnect();
+        state = window.__graphsReady = {token, startedAt: performance.now(), renderedAt: null,
+                                        lastMutation: performance.now(), observed: new Set()};
+        state.observer = new MutationObserver(() => { state.lastMutation = performance.now(); });
+    }
+
+    const empty = [];
+    const statuses = Object.entries(xpaths).map(([name, xpath]) => {
+        const el = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (!el || el.getBoundingClientRect().height === 0) return false;
+        // Watch only the graph containers; a newly mounted container counts as a change
+        if (!state.observed.has(el)) {
+            state.observed.add(el);
+            state.observer.observe(el, {childList: true, subtree: true, characterData: true});
+            state.lastMutation = performance.now();
+        }
+        const values = Array.from(el.querySelectorAll('.data-value'));
+        if (values.length > 0) return values.every(node => node.textContent.trim() !== '');
+        if (el.querySelector(noDataSelector) || /no data/i.test(el.textContent)) {
+            empty.push(name);
+            return true;
+        }
+        return false;
+    });
+    if (!statuses.every(Boolean)) {
+        state.renderedAt = null;
+        return false;
+    }
+
+    const now = performance.now();
+    if (state.renderedAt === null) state.renderedAt = now;
+    if (now - state.lastMutation < settleMs) return false;
+
+    state.observer.disconnect();
+    delete window.__graphsReady;
+    return {startedAt: state.startedAt, renderedAt: state.renderedAt, readyAt: now, empty};
+}"""
+
+# Reads status and .data-value texts of every graph in one round trip; graphs whose
+# container is missing or hidden come back as null so the caller can fall back.
+GRAPH_DATA_JS = """(graphs) => {
+    const result = {};
+    for (const [name, xpath] of Object.entries(graphs)) {
+        const el = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (!el || el.getBoundingClientRect().height === 0) {
+            result[name] = null;
+            continue;
+        }
+        const values = Array.from(el.querySelectorAll('.data-value'), node => node.innerText.trim());
+        result[name] = values.length ? {status: "ok", values} : {status: "no_data", values: []};
+    }
+    return result;
+}"""
+
+# Visibility and page-relative bounding box of every graph, plus the device pixel ratio,
+# so one screenshot of the page can be cropped per graph.
+GRAPH_BOXES_JS = """(graphs) => {
+    const boxes = {};
+    for (const [name, xpath] of Object.entries(graphs)) {
+        const el = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        const rect = el ? el.getBoundingClientRect() : null;
+        const style = el ? getComputedStyle(el) : null;
+        const visible = !!rect && rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden';
+        boxes[name] = visible ? {x: rect.left + window.scrollX, y: rect.top + window.scrollY,
+                                 width: rect.width, height: rect.height} : null;
+    }
+    return {boxes, dpr: window.devicePixelRatio};
+}"""
+
 
 
     
 class GraphPage(BasePage):
+    # DOM must stay unchanged this long before graphs count as rendered
+    GRAPH_SETTLE_MS = 300
+    # Fixed sleeps the event-driven waits replace, used to report the time saved
+    LEGACY_RENDER_SLEEP_MS = 3000
+    LEGACY_FILTER_SLEEP_MS = 2000
+    # Explicit "no data" placeholder a graph card shows when its dataset is empty
+    NO_DATA_MARKER = ".no-data, .no-data-found, [ng-if*='noData'], [ng-show*='noData']"
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -35,6 +126,20 @@ class GraphPage(BasePage):
         self.LOB_FILTER = 'xpath=//md-select[@name="lob"]'
         self.TIER_FILTER = 'xpath=//md-select[@name="Tier"]'
         self.FILTERS_SEARCH = 'xpath=//*[@id="filter_list"]//button[.//span[contains(text(), "Search")]]'
+        # Graphs that settled without data in the last wait_for_graphs_to_load
+        self.empty_graphs = []
+        self.filter_locators = {
+            "branch": self.BRANCH_FILTER,
+            "dsr": self.DSR_FILTER,
+            "lob": self.LOB_FILTER,
+            "tier": self.TIER_FILTER
+        }
+
+        # Backing API responses per graph, URL regexes from data/graph_responses.json
+        self.responses = ResponseCapture(page)
+        for name, pattern in ConfigService.get("graph_responses")["graphs"].items():
+            if pattern:
+                self.responses.register(name, pattern)
 
 
 
@@ -44,33 +149,94 @@ class GraphPage(BasePage):
         self.wait_for_state()
 
 
-    def wait_for_graphs_to_load(self,timeout=30000):
-        for selector in self.graph_containers.values():
-            self.wait_for_state(selector=selector, state="visible", timeout=timeout)
-        time.sleep(3)  # Extra wait for animations or rendering
+    def wait_for_graphs_to_load(self, timeout=30000, settle_ms=None, legacy_sleep_ms=LEGACY_RENDER_SLEEP_MS):
+        """
+        Wait in the browser, in a single call, until every graph has rendered non-empty
+        .data-value nodes (or shows a no-data marker) and the graph containers have stopped
+        changing for `settle_ms`. Graphs that settled empty are kept in `self.empty_graphs`.
+        Returns the fixed sleep time (ms) this saved compared with `legacy_sleep_ms`.
+        """
+        timeout = self._timeout(timeout, "wait_for_graphs_to_load")
+        settle_ms = self.GRAPH_SETTLE_MS if settle_ms is None else settle_ms
+        xpaths = {key: selector[len("xpath="):] for key, selector in self.graph_containers.items()}
 
+        try:
+            handle = self.page.wait_for_function(
+                GRAPHS_READY_JS,
+                arg={"token": uuid.uuid4().hex, "xpaths": xpaths, "settleMs": settle_ms,
+                     "noDataSelector": self.NO_DATA_MARKER},
+                timeout=timeout,
+                polling=100
+            )
+        except Exception as e:
+            self.logger.error(f"Graphs did not finish rendering in time: {str(e)}")
+            raise
+
+        timings = handle.json_value()
+        settle_cost_ms = timings["readyAt"] - timings["renderedAt"]
+        saved_ms = round(max(0, legacy_sleep_ms - settle_cost_ms), 1)
+        self.logger.info(
+            f"Graphs ready after {timings['readyAt'] - timings['startedAt']:.0f} ms "
+            f"(settle {settle_cost_ms:.0f} ms, saved {saved_ms} ms of fixed sleep)"
+        )
+        self.empty_graphs = timings["empty"]
+        if self.empty_graphs:
+            self.logger.info(f"Graphs rendered with no data: {', '.join(self.empty_graphs)}")
+            run_metadata.increment("graph_readiness", "empty_graphs", len(self.empty_graphs))
+        run_metadata.increment("graph_readiness", "waits")
+        run_metadata.increment("graph_readiness", "sleep_saved_ms", saved_ms)
+        return saved_ms
+
+
+    def are_all_graphs_visible(self, capture_screenshots=False):
+        """
+        Check if all graphs are visible with a single page evaluation.
+        With capture_screenshots, one full-page screenshot is taken and cropped per graph
+        into reports/<name>_graph.png.
+        """
+        xpaths = {key: selector[len("xpath="):] for key, selector in self.graph_containers.items()}
+        try:
+            layout = self.page.evaluate(GRAPH_BOXES_JS, xpaths)
+        except Exception as e:
+            self.logger.error(f"Could not read graph boxes: {str(e)}")
+            return False
 
-    def are_all_graphs_visible(self):
-        """Check if all graphs are visible and take element-level screenshots."""
-        all_visible = True
-        for name, selector in self.graph_containers.items():
-            try:
-                if not self.page.is_visible(selector):
-                    print(f"Graph not visible: {name}")
-                    all_visible = False
+        hidden = [name for name, box in layout["boxes"].items() if box is None]
+        for name in hidden:
+            self.logger.warning(f"Graph not visible: {name}")
 
-                element = self.page.locator(selector)
-                element.screenshot(path=f"reports/{name}_graph.png")
+        if capture_screenshots:
+            visible_boxes = {name: box for name, box in layout["boxes"].items() if box is not None}
+            try:
+                self._save_graph_crops(visible_boxes, layout["dpr"])
             except Exception as e:
-                print(f"Error processing {name}: {e}")
-                all_visible = False
-        return all_visible
+                self.logger.error(f"Error capturing graph screenshots: {str(e)}")
+                return False
+
+        return not hidden
+
+    def _save_graph_crops(self, boxes, dpr, output_dir="reports"):
+        """Crop every graph out of one full-page screenshot; per-graph clips if Pillow is missing."""
+        os.makedirs(output_dir, exist_ok=True)
+        try:
+            from PIL import Image
+        except ImportError:
+            self.logger.info("Pillow not installed; taking one clipped screenshot per graph")
+            for name, box in boxes.items():
+                self.page.screenshot(path=f"{output_dir}/{name}_graph.png", full_page=True, clip=box)
+            return
+
+        image = Image.open(io.BytesIO(self.page.screenshot(full_page=True)))
+        for name, box in boxes.items():
+            crop = tuple(round(value * dpr) for value in
+                         (box["x"], box["y"], box["x"] + box["width"], box["y"] + box["height"]))
+            image.crop(crop).save(f"{output_dir}/{name}_graph.png")
 
     def get_graph_data(self, graph_selector):
         """Extract .data-value text from a graph, safely handling missing elements."""
         graph = self.page.locator(graph_selector)
         try:
-            graph.wait_for(state="visible", timeout=5000)
+            graph.wait_for(state="visible", timeout=self._timeout(5000, f"get_graph_data({graph_selector})"))
         except Exception as e:
             self.logger.warning(f"Graph not found for selector: {graph_selector}. Error: {str(e)}")
             return {"status": "not_found", "values": []}
@@ -93,9 +259,19 @@ class GraphPage(BasePage):
 
 
     def get_all_graph_data(self):
-        """Fetch data values and status from all graphs."""
+        """
+        Fetch data values and status from all graphs in a single page evaluation.
+        Graphs whose container is not on the page yet fall back to get_graph_data.
+        """
+        xpaths = {key: selector[len("xpath="):] for key, selector in self.graph_containers.items()}
+        try:
+            snapshot = self.page.evaluate(GRAPH_DATA_JS, xpaths)
+        except Exception as e:
+            self.logger.warning(f"Batched graph extraction failed, reading graphs one by one: {str(e)}")
+            snapshot = {}
+
         return {
-            key: self.get_graph_data(selector)
+            key: snapshot.get(key) or self.get_graph_data(selector)
             for key, selector in self.graph_containers.items()
         }
 
@@ -125,18 +301,54 @@ class GraphPage(BasePage):
 
 
 
-        # Step 5: Click the Search button to apply filters
-        self.click_element(self.FILTERS_SEARCH)
-        self.logger.info("Clicked Search button to apply filters")
+        # Step 5: Click the Search button to apply filters, recording the graph API responses
+        # until the filtered data has arrived
+        with self.responses.capture(timeout=self._timeout(30000, "change_filter graph responses")):
+            self.click_element(self.FILTERS_SEARCH)
+            self.logger.info("Clicked Search button to apply filters")
+            self.wait_for_state()
 
 
-        # Step 6: Wait for graphs to load
-        self.wait_for_graphs_to_load()
-        self.page.wait_for_timeout(2000)   # Optional wait for rendering
+        # Step 6: Wait for the graphs to re-render
+        self.wait_for_graphs_to_load(legacy_sleep_ms=self.LEGACY_RENDER_SLEEP_MS + self.LEGACY_FILTER_SLEEP_MS)
 
         return True
 
 
+    def discover_filter_options(self):
+        """
+        Read the option lists of the branch, DSR, LOB and tier filters in their unfiltered state.
+        Dependent lists (e.g. DSRs of one branch) are not expanded, so FilterCatalog does not
+        validate a DSR against them when the case also sets a branch.
+        """
+        self.click_element(self.FILTERS_BUTTON)
+        options = {}
+        for field, locator in self.filter_locators.items():
+            try:
+                options[field] = self.read_dropdown_options(locator)
+            except Exception as e:
+                self.logger.warning(f"Could not read options for {field}: {str(e)}")
+        self.page.keyboard.press("Escape")
+        self.logger.info(f"Discovered filter options: { {field: len(values) for field, values in options.items()} }")
+        return options
+
+    def get_graph_api_data(self):
+        """
+        Parsed JSON payloads of the graph API responses captured by the last change_filter,
+        keyed by graph name. Only graphs with a pattern in data/graph_responses.json appear.
+        """
+        return dict(self.responses.data)
+
+    def get_graph_api_errors(self):
+        """Graphs whose captured API response failed or carried no payload, with the reason."""
+        errors = {}
+        for name, captured in self.responses.data.items():
+            if captured["status"] >= 400:
+                errors[name] = f"HTTP {captured['status']} from {captured['url']}"
+            elif captured["payload"] in (None, [], {}):
+                errors[name] = f"empty payload from {captured['url']}"
+        return errors
+
     def get_branch_value(self):
         """Return the current selected branch value."""
         branch_element = self.page.query_selector("text=Main Branch")
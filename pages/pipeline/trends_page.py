@@ -5,6 +5,71 @@ from pages.base_page import BasePage
 from playwright.sync_api import Page, expect
 import time
 
+# For your specific use case, here are the selectors to use:
+
+pipeline_graph_containers = {
+    # Main container for visibility check
+    "pipeline_sufficiency_graph": "//div[contains(@class, 'growth_opportunities')]//md-card[contains(@class, 'sell_out_by_brand')]",
+    
+    # FusionCharts specific container
+    "fusioncharts_container": "//span[contains(@class, 'fusioncharts-container')]",
+    
+    # SVG chart element
+    "chart_svg": "//svg[@id[starts-with(., 'raphael-paper')]]",
+    
+    # For data extraction - chart elements
+    "chart_data_elements": "//svg[@id[starts-with(., 'raphael-paper')]]//g[contains(@class, 'raphael-group')]//rect[@fill-opacity='1']",
+}
+
+# Reads labels, series values and legend entries of every rendered chart straight from the
+# FusionCharts JS API. Returns null when FusionCharts is not on the page.
+FUSIONCHARTS_DATA_JS = """() => {
+    if (!window.FusionCharts || !window.FusionCharts.items) return null;
+    const toNumber = value => (value === undefined || value === null || value === '') ? null : Number(value);
+
+    return Object.values(window.FusionCharts.items)
+        .filter(chart => chart.hasRendered && chart.hasRendered())
+        .map(chart => {
+            let data = {};
+            try { data = chart.getJSONData() || {}; } catch (e) { data = {}; }
+
+            let labels, series;
+            if (Array.isArray(data.dataset)) {
+                labels = (((data.categories || [])[0] || {}).category || []).map(c => c.label);
+                series = data.dataset.map(ds => ({
+                    name: ds.seriesname || null,
+                    values: (ds.data || []).map(point => toNumber(point.value))
+                }));
+            } else {
+                const points = data.data || [];
+                labels = points.map(point => point.label);
+                series = [{name: (data.chart || {}).caption || null, values: points.map(point => toNumber(point.value))}];
+            }
+
+            return {
+                id: chart.id,
+                type: chart.chartType ? chart.chartType() : null,
+                caption: (data.chart || {}).caption || null,
+                labels,
+                series,
+                legend: series.map(s => s.name).filter(Boolean)
+            };
+        });
+}"""
+
+# SVG fallback: every bar/column rect and legend text of one chart container in one call.
+SVG_CHART_DATA_JS = """(xpath) => {
+    const root = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!root) return null;
+    const rects = Array.from(root.querySelectorAll("svg rect[fill-opacity='1']"), rect =>
+        `h:${rect.getAttribute('height')},w:${rect.getAttribute('width')},y:${rect.getAttribute('y')}`);
+    const attrs = Array.from(root.querySelectorAll('[data-value], [data-original-value]'), el =>
+        el.getAttribute('data-value') || el.getAttribute('data-original-value') || 'no_value');
+    const legend = Array.from(root.querySelectorAll("g[class*='legend'] text"), text => text.textContent.trim())
+        .filter(Boolean);
+    return {rects, attrs, legend};
+}"""
+
 
 
 class TrendsGraphPage(BasePage):
@@ -52,166 +117,153 @@ class TrendsGraphPage(BasePage):
     # Chart visible state
     CHART_VISIBLE = "//div[@ng-if='trendChartShow']"
 
-# For your specific use case, here are the selectors to use:
+    # CSS (querySelectorAll) also matches SVG-namespaced elements, which //svg XPath misses
+    CHART_SVG_CSS = "css=svg[id^='raphael-paper']"
+    CHART_DATA_ELEMENTS_CSS = "css=svg rect[fill-opacity='1']"
 
-pipeline_graph_containers = {
-    # Main container for visibility check
-    "pipeline_sufficiency_graph": "//div[contains(@class, 'growth_opportunities')]//md-card[contains(@class, 'sell_out_by_brand')]",
-    
-    # FusionCharts specific container
-    "fusioncharts_container": "//span[contains(@class, 'fusioncharts-container')]",
-    
-    # SVG chart element
-    "chart_svg": "//svg[@id[starts-with(., 'raphael-paper')]]",
-    
-    # For data extraction - chart elements
-    "chart_data_elements": "//svg[@id[starts-with(., 'raphael-paper')]]//g[contains(@class, 'raphael-group')]//rect[@fill-opacity='1']",
-}
+    def are_all_graphs_visible(self):
+        """Check if all graphs are visible and take element-level screenshots."""
+        all_visible = True
+        
+        # Updated selectors
+        graph_selectors = {
+            "pipeline_sufficiency_main": "//div[contains(@class, 'growth_opportunities')]//md-card[contains(@class, 'sell_out_by_brand')]",
+            "fusioncharts_svg": self.CHART_SVG_CSS,
+            "chart_container": "//span[contains(@class, 'fusioncharts-container')]"
+        }
+        
+        for name, selector in graph_selectors.items():
+            try:
+                if not self.page.is_visible(selector):
+                    self.logger.warning(f"Graph not visible: {name}")
+                    all_visible = False
+                else:
+                    element = self.page.locator(selector).first
+                    element.screenshot(path=f"reports/{name}_graph.png")
+            except Exception as e:
+                self.logger.error(f"Error processing {name}: {str(e)}")
+                all_visible = False
+        return all_visible
 
+    def get_chart_data(self):
+        """
+        Snapshot every trends chart in one page evaluation.
+        Uses the FusionCharts JS API (labels, numeric series values, legend) and only falls
+        back to parsing the SVG when no FusionCharts instance is available.
+        """
+        start_time = time.perf_counter()
+        try:
+            charts = self.page.evaluate(FUSIONCHARTS_DATA_JS)
+        except Exception as e:
+            self.logger.warning(f"FusionCharts API not readable, falling back to SVG: {str(e)}")
+            charts = None
 
+        if charts:
+            result = {"status": "ok", "source": "fusioncharts", "charts": charts}
+        else:
+            svg_data = self.get_graph_data(pipeline_graph_containers["pipeline_sufficiency_graph"])
+            result = {**svg_data, "source": "svg"}
 
-# Updated methods for your class:
+        self.logger.info(f"Trends snapshot ({result['source']}) took {(time.perf_counter() - start_time) * 1000:.1f} ms")
+        return result
 
-def are_all_graphs_visible(self):
-    """Check if all graphs are visible and take element-level screenshots."""
-    all_visible = True
-    
-    # Updated selectors
-    graph_selectors = {
-        "pipeline_sufficiency_main": "//div[contains(@class, 'growth_opportunities')]//md-card[contains(@class, 'sell_out_by_brand')]",
-        "fusioncharts_svg": "//svg[@id[starts-with(., 'raphael-paper')]]",
-        "chart_container": "//span[contains(@class, 'fusioncharts-container')]"
-    }
-    
-    for name, selector in graph_selectors.items():
+    def get_graph_data(self, graph_selector):
+        """Extract data from a FusionCharts graph's SVG in a single evaluation."""
+        graph = self.page.locator(graph_selector)
         try:
-            if not self.page.is_visible(selector):
-                print(f"Graph not visible: {name}")
-                all_visible = False
-            else:
-                element = self.page.locator(selector)
-                element.screenshot(path=f"reports/{name}_graph.png")
+            graph.wait_for(state="visible", timeout=self._timeout(5000, f"get_graph_data({graph_selector})"))
         except Exception as e:
-            print(f"Error processing {name}: {e}")
-            all_visible = False
-    return all_visible
-
-def get_graph_data(self, graph_selector):
-    """Extract data from FusionCharts graph."""
-    graph = self.page.locator(graph_selector)
-    try:
-        graph.wait_for(state="visible", timeout=5000)
-    except Exception as e:
-        self.logger.warning(f"Graph not found for selector: {graph_selector}. Error: {str(e)}")
-        return {"status": "not_found", "values": []}
-
-    # For FusionCharts, we need to extract data differently
-    # Try to get data from chart elements
-    try:
-        # Method 1: Try to get data from SVG rect elements (chart bars/columns)
-        chart_rects = graph.locator("//svg//rect[@fill-opacity='1']")
-        rect_count = chart_rects.count()
-        
-        if rect_count > 0:
-            # Extract height or other attributes that represent data
-            values = []
-            for i in range(rect_count):
-                try:
-                    rect = chart_rects.nth(i)
-                    height = rect.get_attribute("height")
-                    width = rect.get_attribute("width")
-                    y_pos = rect.get_attribute("y")
-                    values.append(f"h:{height},w:{width},y:{y_pos}")
-                except Exception as e:
-                    values.append("error")
-            return {"status": "ok", "values": values, "type": "svg_data"}
-        
-        # Method 2: Try to get data from tooltip or data attributes
-        data_elements = graph.locator("[data-value], [data-original-value]")
-        data_count = data_elements.count()
-        
-        if data_count > 0:
-            values = []
-            for i in range(data_count):
-                try:
-                    element = data_elements.nth(i)
-                    value = element.get_attribute("data-value") or element.get_attribute("data-original-value")
-                    values.append(value or "no_value")
-                except Exception:
-                    values.append("error")
-            return {"status": "ok", "values": values, "type": "data_attributes"}
-        
-        # Method 3: Check if chart is loading or has no data
-        loading_indicator = self.page.locator("//div[@ng-show='!trendChartShow']")
-        if loading_indicator.is_visible():
-            return {"status": "loading", "values": []}
-        
-        return {"status": "no_data", "values": []}
-        
-    except Exception as e:
-        self.logger.warning(f"Failed to extract data from {graph_selector}: {str(e)}")
-        return {"status": "error", "values": [], "error": str(e)}
-
-def get_all_graph_data(self):
-    """Fetch data values and status from all graphs."""
-    selectors = {
-        "pipeline_sufficiency_chart": "//div[contains(@class, 'growth_opportunities')]//md-card[contains(@class, 'sell_out_by_brand')]",
-        "fusioncharts_svg": "//svg[@id[starts-with(., 'raphael-paper')]]",
-    }
-    
-    return {
-        key: self.get_graph_data(selector)
-        for key, selector in selectors.items()
-    }
-
-# Additional helper methods for FusionCharts interaction:
-
-def wait_for_chart_to_load(self):
-    """Wait for FusionCharts to fully load."""
-    try:
-        # Wait for the chart container to be visible
-        self.page.wait_for_selector("//span[contains(@class, 'fusioncharts-container')]", timeout=10000)
-        
-        # Wait for SVG to be present
-        self.page.wait_for_selector("//svg[@id[starts-with(., 'raphael-paper')]]", timeout=10000)
-        
-        # Wait for chart elements to be rendered
-        self.page.wait_for_selector("//svg//rect[@fill-opacity='1']", timeout=10000)
-        
-        return True
-    except Exception as e:
-        self.logger.warning(f"Chart failed to load: {str(e)}")
-        return False
+            self.logger.warning(f"Graph not found for selector: {graph_selector}. Error: {str(e)}")
+            return {"status": "not_found", "values": []}
 
-def get_chart_legend_data(self):
-    """Extract legend information from the chart."""
-    try:
-        legend_elements = self.page.locator("//g[contains(@class, 'legend')]//text")
-        legend_count = legend_elements.count()
-        
-        legend_items = []
-        for i in range(legend_count):
-            try:
-                text = legend_elements.nth(i).inner_text().strip()
-                if text:  # Only add non-empty text
-                    legend_items.append(text)
-            except Exception:
-                continue
-                
-        return legend_items
-    except Exception as e:
-        self.logger.warning(f"Failed to extract legend data: {str(e)}")
-        return []
-
-def interact_with_chart_element(self, element_index=0):
-    """Hover over chart element to trigger tooltip."""
-    try:
-        chart_elements = self.page.locator("//svg//rect[@fill-opacity='1']")
-        if chart_elements.count() > element_index:
-            chart_elements.nth(element_index).hover()
-            # Wait for tooltip to appear
-            self.page.wait_for_selector("//div[contains(@class, 'fc__tooltip')]", timeout=2000)
+        try:
+            data = self.page.evaluate(SVG_CHART_DATA_JS, graph_selector)
+            if data is None:
+                return {"status": "not_found", "values": []}
+
+            # Method 1: SVG rect elements (chart bars/columns)
+            if data["rects"]:
+                return {"status": "ok", "values": data["rects"], "type": "svg_data", "legend": data["legend"]}
+
+            # Method 2: data attributes
+            if data["attrs"]:
+                return {"status": "ok", "values": data["attrs"], "type": "data_attributes", "legend": data["legend"]}
+
+            # Method 3: Check if chart is loading or has no data
+            loading_indicator = self.page.locator("//div[@ng-show='!trendChartShow']")
+            if loading_indicator.is_visible():
+                return {"status": "loading", "values": []}
+
+            return {"status": "no_data", "values": []}
+
+        except Exception as e:
+            self.logger.warning(f"Failed to extract data from {graph_selector}: {str(e)}")
+            return {"status": "error", "values": [], "error": str(e)}
+
+    def get_all_graph_data(self):
+        """
+        Fetch data values and status from all graphs through get_chart_data: one entry per
+        FusionCharts chart (in page order), or the SVG fallback for the main chart card.
+        """
+        snapshot = self.get_chart_data()
+        if snapshot["source"] != "fusioncharts":
+            return {"pipeline_sufficiency_chart": snapshot}
+
+        graphs = {}
+        for index, chart in enumerate(snapshot["charts"]):
+            values = [value for series in chart["series"] for value in series["values"]]
+            graphs[f"chart_{index}"] = {
+                "status": "ok" if values else "no_data",
+                "values": values,
+                "labels": chart["labels"],
+                "caption": chart["caption"],
+                "source": "fusioncharts",
+            }
+        return graphs
+
+    # Additional helper methods for FusionCharts interaction:
+
+    def wait_for_chart_to_load(self):
+        """Wait for FusionCharts to fully load."""
+        try:
+            # Wait for the chart container to be visible
+            self.page.wait_for_selector("//span[contains(@class, 'fusioncharts-container')]",
+                                        timeout=self._timeout(10000, "wait_for_chart_to_load container"))
+            
+            # Wait for SVG to be present
+            self.page.wait_for_selector(self.CHART_SVG_CSS,
+                                        timeout=self._timeout(10000, "wait_for_chart_to_load svg"))
+            
+            # Wait for chart elements to be rendered
+            self.page.wait_for_selector(self.CHART_DATA_ELEMENTS_CSS,
+                                        timeout=self._timeout(10000, "wait_for_chart_to_load rects"))
+            
             return True
-    except Exception as e:
-        self.logger.warning(f"Failed to interact with chart element: {str(e)}")
-    return False
+        except Exception as e:
+            self.logger.warning(f"Chart failed to load: {str(e)}")
+            return False
+
+    def get_chart_legend_data(self):
+        """Extract legend entries, from the FusionCharts series names when available."""
+        try:
+            snapshot = self.get_chart_data()
+            if snapshot["source"] == "fusioncharts":
+                return [name for chart in snapshot["charts"] for name in chart["legend"]]
+            return snapshot.get("legend", [])
+        except Exception as e:
+            self.logger.warning(f"Failed to extract legend data: {str(e)}")
+            return []
+
+    def interact_with_chart_element(self, element_index=0):
+        """Hover over chart element to trigger tooltip (visual check only; values come from get_chart_data)."""
+        try:
+            chart_elements = self.page.locator(self.CHART_DATA_ELEMENTS_CSS)
+            if chart_elements.count() > element_index:
+                chart_elements.nth(element_index).hover()
+                # Wait for tooltip to appear
+                self.page.wait_for_selector("//div[contains(@class, 'fc__tooltip')]",
+                                            timeout=self._timeout(2000, "interact_with_chart_element tooltip"))
+                return True
+        except Exception as e:
+            self.logger.warning(f"Failed to interact with chart element: {str(e)}")
+        return False
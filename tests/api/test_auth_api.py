@@ -70,6 +70,29 @@ class TestAuthAPI:
         first_user = user_list[0]
         assert first_user["id"] == user_id, f"Expected user ID {user_id}, but got {first_user['id']}"
 
+    @pytest.fixture
+    def fresh_api_context(self, playwright, login_config):
+        """Dedicated request context, so a test login does not change the cookies of shared contexts."""
+        request_context = playwright.request.new_context(
+            base_url=login_config["api"]["base_url"],
+            extra_http_headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json"
+            }
+        )
+        yield request_context
+        request_context.dispose()
+
+    def test_create_session_without_browser(self, fresh_api_context, login_config):
+        """Test that an API login yields a reusable session without the UI."""
+        client = AuthAPIClient(fresh_api_context, login_config["api"]["base_url"])
+        session = client.create_session(
+            email=login_config["login"]["email"],
+            password=login_config["login"]["password"]
+        )
+        assert session["user_id"], "User ID not found in API session"
+        assert session["token"] or session["cookies"], "API login returned neither a token nor cookies"
+
     def test_logout(self, auth_client:AuthAPIClient):
         """Test logout functionality."""
         response = auth_client.logout()
@@ -7,7 +7,9 @@ from playwright.sync_api import Page
 from pages.pipeline.pipeline_suffciency_page import GraphPage
 
 # Import filter data accessor (or import from conftest if moved there)
-from conftest import get_filters_data
+from conftest import get_filter_params, fetch_app_version
+from common_utils.filter_catalog import FilterCatalog
+from pages.pipeline.filter_session import FilterSession
 
 
 @pytest.fixture(scope="function")
@@ -27,6 +29,46 @@ def graph_page(authenticated_page) -> GraphPage:
     return graph_page
 
 
+@pytest.fixture(scope="module")
+def filter_session(authenticated_page, graph_snapshots, api_request_context, login_config) -> FilterSession:
+    """
+    One Pipeline Sufficiency dashboard kept open for every filter case in this module.
+    Snapshots of an older app version are dropped before the module starts.
+    Navigation and dropdown savings are recorded in the run metadata at teardown.
+    """
+    graph_snapshots.set_app_version(fetch_app_version(api_request_context, login_config))
+    session = FilterSession(GraphPage(authenticated_page), snapshots=graph_snapshots)
+    yield session
+    session.record()
+
+
+@pytest.fixture(scope="session")
+def filter_catalog(authenticated_page, app_version) -> FilterCatalog:
+    """
+    Filter dropdown options for this app version: read from the cache, or discovered
+    once per session on the Pipeline Sufficiency page and cached.
+    """
+    catalog = FilterCatalog.load(app_version)
+    if catalog is None:
+        discovery_page = GraphPage(authenticated_page)
+        discovery_page.navigate_to_pipeline_sufficiency()
+        discovery_page.wait_for_graphs_to_load()
+        catalog = FilterCatalog(discovery_page.discover_filter_options(), app_version)
+        catalog.save()
+    return catalog
+
+
+@pytest.fixture
+def checked_filters(filters, filter_catalog):
+    """Skip filter cases the app can never satisfy before any UI work is done."""
+    if not filters:
+        pytest.skip("No filter data available or empty filter")
+    reason = filter_catalog.validate(filters)
+    if reason:
+        pytest.skip(reason)
+    return filters
+
+
 class TestGraphPage:
     """
     Test class for Pipeline Sufficiency dashboard.
@@ -38,30 +80,23 @@ class TestGraphPage:
         Test that all graphs load initially on the Pipeline Sufficiency dashboard.
         """
         graph_page.wait_for_graphs_to_load()
-        assert graph_page.are_all_graphs_visible(), "Not all graphs are visible on the page"
+        assert graph_page.are_all_graphs_visible(capture_screenshots=True), "Not all graphs are visible on the page"
 
-    @pytest.mark.parametrize("filters", get_filters_data())
-    def test_graphs_respond_to_filter_changes(self, graph_page:GraphPage, authenticated_page, filters):
+    @pytest.mark.parametrize("filters", get_filter_params())
+    def test_graphs_respond_to_filter_changes(self, checked_filters, filter_session:FilterSession, filters):
         """
         Test that graphs respond correctly when filters are applied.
-        Uses the session-scoped authenticated page for all filter combinations.
+        Cases run in planned order on one open dashboard; only the differing dropdowns are changed.
         """
-        # Skip if no filters data
-        if not filters:
-            pytest.skip("No filter data available or empty filter")
-        
-        # Wait for graphs to load
-        graph_page.wait_for_graphs_to_load()
-        
-        # Capture initial data
-        initial_data = graph_page.get_all_graph_data()
-        
-        # Apply filters
-        filter_success = graph_page.change_filter(**filters)
+        graph_page = filter_session.graph_page
+
+        # Apply filters on top of the previous case
+        filter_success = filter_session.apply(filters)
         assert filter_success, f"Failed to apply filters: {filters}"
         
-        # Wait for changes to take effect
-        authenticated_page.wait_for_load_state("networkidle")
+        # Verify the graph API responses behind the filtered graphs (those with a pattern configured)
+        api_errors = graph_page.get_graph_api_errors()
+        assert not api_errors, f"Graph API responses failed after applying filters {filters}: {api_errors}"
         
         # Verify all graphs are still visible
         assert graph_page.are_all_graphs_visible(), "Not all graphs are visible after filtering"
@@ -69,10 +104,7 @@ class TestGraphPage:
         # Capture data after filtering
         filtered_data = graph_page.get_all_graph_data()
         
-        # Verify data changed
+        # Verify data changed against the cached unfiltered dashboard
         assert graph_page.verify_data_changes_after_filter(
-            initial_data, filtered_data
+            filter_session.baseline, filtered_data
         ), f"Graph data did not change after applying filters: {filters}"
-
-
-   
\ No newline at end of file
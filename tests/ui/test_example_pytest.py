@@ -7,21 +7,12 @@ from playwright.sync_api import Page, expect
 from pages.login.login_page import LoginPage
 from pages.dashboard.dashboard_page import DashboardPage
 from pages.dashboard.report_page import ReportPage
-
-def load_config(config_path='data/login_config.json'):
-    """Load test configuration"""
-    try:
-        with open(config_path, 'r') as config_file:
-            return json.load(config_file)
-    except Exception as e:
-        # If config file not found, use default values
-        print(f"Warning: Could not load config: {str(e)}")
-        
+from common_utils.config import ConfigService
 
 @pytest.fixture
 def test_config():
     """Fixture to provide test configuration"""
-    return load_config()
+    return ConfigService.get("login_config")
 
 # def test_login_and_download_report(page: Page, test_config):
 #     """Test login and report download"""
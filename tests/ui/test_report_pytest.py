@@ -13,6 +13,10 @@ from bs4 import BeautifulSoup
 from pages.login.login_page import LoginPage
 from pages.dashboard.dashboard_page import DashboardPage
 from pages.dashboard.report_page import ReportPage
+from pages.dashboard.download_orchestrator import DownloadOrchestrator
+from common_utils.config import thaw
+from common_utils.navigation_planner import NavigationPlanner
+from common_utils.run_metadata import run_metadata
 
 # Import report validator
 # from common_utils.report_validator import ReportValidator, ReportValidationRunner
@@ -28,38 +32,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def load_config(config_path):
-    """Load configuration from JSON file with default fallback"""
-    try:
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(config_path), exist_ok=True)
-        
-        # Check if file exists
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as config_file:
-                return json.load(config_file)
-        else:
-            logger.warning(f"Config file not found: {config_path}")
-            return {}
-    except Exception as e:
-        logger.error(f"Error loading config: {str(e)}")
-
-@pytest.fixture
-def login_config():
-    """Fixture to provide login configuration"""
-    return load_config('data/login_config.json')
-
-@pytest.fixture
-def reports_navigation_config():
-    """Fixture to provide reports configuration"""
-    return load_config('data/reports_navigation.json')
-
-@pytest.fixture
-def validator_config():
-    """Fixture to provide validator configuration"""
-  
-    return load_config('data/validator_config.json')
-
 @pytest.fixture
 def download_path():
     """Fixture for download path"""
@@ -67,92 +39,53 @@ def download_path():
     os.makedirs(path, exist_ok=True)
     return path
 
-def test_download_and_validate_reports(page: Page, login_config, reports_navigation_config, validator_config, download_path):
-    """Test to download and validate multiple reports"""
+def test_download_and_validate_reports(page: Page, login_config, reports_navigation_config, validator_config, download_path, route_cache, prefetch_pages):
+    """Download every report over several tabs of the logged-in context and validate the files"""
     # Step 1: Login
     login_page = LoginPage(page)
     page.goto(login_config["login"]["url"] ,timeout=60000, wait_until="domcontentloaded")
-    page.wait_for_load_state("networkidle")
+    login_page.wait_for_state()
     
     login_page.login(
         email=login_config["login"]["email"],
         password=login_config["login"]["password"]
     )
-    
-    # Initialize pages
-    dashboard_page = DashboardPage(page)
-    report_page = ReportPage(page)
-    
-    # Always navigate to reports section first
-    dashboard_page.navigate_to_reports()
  
     # Create validation runner
     config_path = os.path.join('input', 'validator_config.json')
+    os.makedirs(os.path.dirname(config_path), exist_ok=True)
     with open(config_path, 'w') as f:
-        json.dump(validator_config, f, indent=2)
+        json.dump(thaw(validator_config), f, indent=2)
     
     # validation_runner = ReportValidationRunner(download_path=download_path, config_path=config_path)
     
-    # Process each report
+    # Download every report; tabs are grouped by section so open sections and views are not clicked again
+    orchestrator = DownloadOrchestrator(
+        page.context,
+        download_dir=download_path,
+        start_url=page.url,
+        routes=route_cache,
+        prefetch_pages=prefetch_pages
+    )
+    results = orchestrator.run(reports_navigation_config)
+
+    # Report the clicks the tabs made against naive navigation
+    summary = orchestrator.navigation_summary()
+    run_metadata.record("report_navigation", summary)
+    logger.info(f"Report navigation: {summary}")
+
+    # Validate the downloaded reports
+    assert len(results) == len(reports_navigation_config), "Not every report was attempted"
     validation_results = {}
-    
-    for report_config in reports_navigation_config:
-        report_name = report_config["name"]
-        logger.info(f"Processing {report_name}")
-        
-        try:
-            # Extract navigation parameters from config
-            report_button = report_config["navigation"]["report"]
-            view_button = report_config["navigation"]["view"]
-            
-            # Navigate to report section
-            logger.info(f"Navigating to report section: {report_button}")
-            dashboard_page.navigate_to_section(report_name, getattr(dashboard_page, report_button))
-            
-            # Navigate to view
-            logger.info(f"Navigating to view: {view_button}")
-            dashboard_page.navigate_to_section(f"{report_name} View", getattr(dashboard_page, view_button))
-            
-            # Handle the download
-            # Get download button information from reports_page
-            menu_button_name = report_config["download"]["button"]
-            download_selector_name = report_config["download"]["selector"]
-            expected_filename = report_config["download"]["filename"]
-            
-            # Click menu button using the constant from reports_page
-            menu_button = getattr(report_page, menu_button_name)
-            page.click(menu_button)
-            page.wait_for_load_state("networkidle")
-            
-            # Get the actual download selector value
-            download_selector = getattr(report_page, download_selector_name)
-            logger.info(f"Downloading report using selector: {download_selector}")
-            
-            # Setup download listener
-            with page.expect_download() as download_info:
-                page.click(download_selector)
-                
-            download = download_info.value
-            # Use expected filename with .xlsx extension (or appropriate extension)
-            download_filename = f"{expected_filename}.xlsx"
-            download_path_full = os.path.join(download_path, download_filename)
-            download.save_as(download_path_full)
-            
-            logger.info(f"Report downloaded to {download_path_full}")
-            
-            # Validate the downloaded report
-            # validation_result = validation_runner.validate_report(download_path_full, report_name)
-            # validation_results[report_name] = validation_result
-            
-            # logger.info(f"Validation result for {report_name}: {validation_result}")
-            
-        except Exception as e:
-            logger.error(f"Error processing {report_name}: {str(e)}")
-            page.screenshot(path=f"reports/{report_name}_error.png")
-            validation_results[report_name] = False
-    
-    # Assert that all validations passed
-    # assert all(validation_results.values()), f"Some validations failed: {validation_results}"
+    for result in results:
+        label = f"{result['name']} ({result['filename']})"
+        if result["error"]:
+            validation_results[label] = result["error"]
+        elif not os.path.exists(result["path"]) or os.path.getsize(result["path"]) == 0:
+            validation_results[label] = f"no file or empty file at {result['path']}"
+        # validation_results[label] = validation_runner.validate_report(result["path"], result["name"])
+
+    assert not validation_results, f"Some reports failed: {validation_results}"
 
 
 